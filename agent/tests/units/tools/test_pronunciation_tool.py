@@ -1,9 +1,12 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from vocab_processor.constants import Language
 from vocab_processor.tools.pronunciation_tool import Pronunciations, get_pronunciation
+from vocab_processor.utils import s3_utils
+from vocab_processor.utils.s3_utils import S3Paths
 
 
 @pytest.mark.anyio
@@ -43,7 +46,11 @@ async def test_get_pronunciation_lambda_context(
     target_language = Language.ENGLISH
 
     # Mock S3 paths
-    mock_generate_s3_paths.return_value = {"audio_prefix": "vocabs/en/hello/audio"}
+    mock_generate_s3_paths.return_value = S3Paths(
+        base_prefix="vocabs/en/hello",
+        audio_prefix="vocabs/en/hello/audio",
+        image_prefix="vocabs/en/hello/images",
+    )
 
     # Act
     response = await get_pronunciation.ainvoke(
@@ -63,25 +70,37 @@ async def test_get_pronunciation_lambda_context(
 
 @pytest.mark.anyio
 @patch("vocab_processor.tools.pronunciation_tool.is_lambda_context", return_value=True)
-@patch("vocab_processor.tools.pronunciation_tool.boto3")
+@patch("vocab_processor.tools.pronunciation_tool.list_s3_prefix")
 @patch("vocab_processor.tools.pronunciation_tool.generate_vocab_s3_paths")
-@patch("os.getenv")
+@patch(
+    "vocab_processor.tools.pronunciation_tool.generate_s3_url",
+    side_effect=lambda key: f"https://test-bucket.s3.amazonaws.com/{key}",
+)
 async def test_get_pronunciation_reuse_existing_files(
-    mock_getenv, mock_generate_s3_paths, mock_boto3, mock_is_lambda_context
+    mock_generate_s3_url,
+    mock_generate_s3_paths,
+    mock_list_prefix,
+    mock_is_lambda_context,
 ):
     # Arrange
     target_word = "hello"
     target_syllables = ["hel", "lo"]
     target_language = Language.ENGLISH
 
-    # Mock environment and S3 paths
-    mock_getenv.return_value = "test-bucket"
-    mock_generate_s3_paths.return_value = {"audio_prefix": "vocabs/en/hello/audio"}
+    # Mock S3 paths
+    mock_generate_s3_paths.return_value = S3Paths(
+        base_prefix="vocabs/en/hello",
+        audio_prefix="vocabs/en/hello/audio",
+        image_prefix="vocabs/en/hello/images",
+    )
 
-    # Mock S3 client to simulate existing files
-    mock_s3_client = MagicMock()
-    mock_boto3.client.return_value = mock_s3_client
-    mock_s3_client.head_object.return_value = {}  # File exists
+    # Simulate existing files
+    mock_list_prefix.return_value = frozenset(
+        {
+            "vocabs/en/hello/audio/pronunciation.mp3",
+            "vocabs/en/hello/audio/syllables.mp3",
+        }
+    )
 
     # Act
     response = await get_pronunciation.ainvoke(
@@ -104,29 +123,26 @@ async def test_get_pronunciation_reuse_existing_files(
         == "https://test-bucket.s3.amazonaws.com/vocabs/en/hello/audio/syllables.mp3"
     )
 
-    # Should check for both files
-    assert mock_s3_client.head_object.call_count == 2
-    mock_s3_client.head_object.assert_any_call(
-        Bucket="test-bucket", Key="vocabs/en/hello/audio/pronunciation.mp3"
-    )
-    mock_s3_client.head_object.assert_any_call(
-        Bucket="test-bucket", Key="vocabs/en/hello/audio/syllables.mp3"
-    )
+    # Should check for both files with a single listing
+    mock_list_prefix.assert_called_once_with("vocabs/en/hello/audio")
 
 
 @pytest.mark.anyio
 @patch("vocab_processor.tools.pronunciation_tool.is_lambda_context", return_value=True)
-@patch("vocab_processor.tools.pronunciation_tool.boto3")
+@patch("vocab_processor.tools.pronunciation_tool.list_s3_prefix")
 @patch("vocab_processor.tools.pronunciation_tool.generate_vocab_s3_paths")
 @patch("vocab_processor.tools.pronunciation_tool.AsyncElevenLabs")
 @patch("vocab_processor.tools.pronunciation_tool.upload_stream_to_s3")
-@patch("os.getenv")
+@patch(
+    "vocab_processor.tools.pronunciation_tool.generate_s3_url",
+    side_effect=lambda key: f"https://test-bucket.s3.amazonaws.com/{key}",
+)
 async def test_get_pronunciation_generate_missing_files(
-    mock_getenv,
+    mock_generate_s3_url,
     mock_upload_s3,
     mock_eleven_labs,
     mock_generate_s3_paths,
-    mock_boto3,
+    mock_list_prefix,
     mock_is_lambda_context,
 ):
     # Arrange
@@ -134,17 +150,15 @@ async def test_get_pronunciation_generate_missing_files(
     target_syllables = ["hel", "lo"]
     target_language = Language.ENGLISH
 
-    # Mock environment and S3 paths
-    mock_getenv.return_value = "test-bucket"
-    mock_generate_s3_paths.return_value = {"audio_prefix": "vocabs/en/hello/audio"}
-
-    # Mock S3 client to simulate no existing files
-    mock_s3_client = MagicMock()
-    mock_boto3.client.return_value = mock_s3_client
-    mock_s3_client.head_object.side_effect = mock_s3_client.exceptions.NoSuchKey(
-        "Not found"
+    # Mock S3 paths
+    mock_generate_s3_paths.return_value = S3Paths(
+        base_prefix="vocabs/en/hello",
+        audio_prefix="vocabs/en/hello/audio",
+        image_prefix="vocabs/en/hello/images",
     )
-    mock_s3_client.exceptions.NoSuchKey = Exception
+
+    # Simulate no existing files
+    mock_list_prefix.return_value = frozenset()
 
     # Mock ElevenLabs and upload
     mock_client = MagicMock()
@@ -187,17 +201,20 @@ async def test_get_pronunciation_generate_missing_files(
 
 @pytest.mark.anyio
 @patch("vocab_processor.tools.pronunciation_tool.is_lambda_context", return_value=True)
-@patch("vocab_processor.tools.pronunciation_tool.boto3")
+@patch("vocab_processor.tools.pronunciation_tool.list_s3_prefix")
 @patch("vocab_processor.tools.pronunciation_tool.generate_vocab_s3_paths")
 @patch("vocab_processor.tools.pronunciation_tool.AsyncElevenLabs")
 @patch("vocab_processor.tools.pronunciation_tool.upload_stream_to_s3")
-@patch("os.getenv")
+@patch(
+    "vocab_processor.tools.pronunciation_tool.generate_s3_url",
+    side_effect=lambda key: f"https://test-bucket.s3.amazonaws.com/{key}",
+)
 async def test_get_pronunciation_mixed_reuse_and_generate(
-    mock_getenv,
+    mock_generate_s3_url,
     mock_upload_s3,
     mock_eleven_labs,
     mock_generate_s3_paths,
-    mock_boto3,
+    mock_list_prefix,
     mock_is_lambda_context,
 ):
     # Arrange
@@ -205,22 +222,17 @@ async def test_get_pronunciation_mixed_reuse_and_generate(
     target_syllables = ["hel", "lo"]
     target_language = Language.ENGLISH
 
-    # Mock environment and S3 paths
-    mock_getenv.return_value = "test-bucket"
-    mock_generate_s3_paths.return_value = {"audio_prefix": "vocabs/en/hello/audio"}
-
-    # Mock S3 client to simulate only audio file exists (not syllables)
-    mock_s3_client = MagicMock()
-    mock_boto3.client.return_value = mock_s3_client
-
-    def head_object_side_effect(Bucket, Key):
-        if "pronunciation.mp3" in Key:
-            return {}  # Audio file exists
-        else:
-            raise mock_s3_client.exceptions.NoSuchKey("Syllables not found")
+    # Mock S3 paths
+    mock_generate_s3_paths.return_value = S3Paths(
+        base_prefix="vocabs/en/hello",
+        audio_prefix="vocabs/en/hello/audio",
+        image_prefix="vocabs/en/hello/images",
+    )
 
-    mock_s3_client.head_object.side_effect = head_object_side_effect
-    mock_s3_client.exceptions.NoSuchKey = Exception
+    # Simulate only audio file exists (not syllables)
+    mock_list_prefix.return_value = frozenset(
+        {"vocabs/en/hello/audio/pronunciation.mp3"}
+    )
 
     # Mock ElevenLabs and upload for syllables generation
     mock_client = MagicMock()
@@ -265,27 +277,38 @@ async def test_get_pronunciation_mixed_reuse_and_generate(
 
 @pytest.mark.anyio
 @patch("vocab_processor.tools.pronunciation_tool.is_lambda_context", return_value=True)
-@patch("vocab_processor.tools.pronunciation_tool.boto3")
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.s3_client")
 @patch("vocab_processor.tools.pronunciation_tool.generate_vocab_s3_paths")
-@patch("os.getenv")
+@patch(
+    "vocab_processor.tools.pronunciation_tool.generate_s3_url",
+    side_effect=lambda key: f"https://test-bucket.s3.amazonaws.com/{key}",
+)
 async def test_get_pronunciation_s3_error_fallback(
-    mock_getenv, mock_generate_s3_paths, mock_boto3, mock_is_lambda_context
+    mock_generate_s3_url,
+    mock_generate_s3_paths,
+    mock_s3_client,
+    mock_is_lambda_context,
 ):
     # Arrange
     target_word = "hello"
     target_syllables = []  # Single syllable, no syllables file needed
     target_language = Language.ENGLISH
 
-    # Mock environment and S3 paths
-    mock_getenv.side_effect = lambda key: (
-        "test-bucket" if key == "S3_MEDIA_BUCKET_NAME" else None
+    # Mock S3 paths
+    mock_generate_s3_paths.return_value = S3Paths(
+        base_prefix="vocabs/en/hello",
+        audio_prefix="vocabs/en/hello/audio",
+        image_prefix="vocabs/en/hello/images",
     )
-    mock_generate_s3_paths.return_value = {"audio_prefix": "vocabs/en/hello/audio"}
 
-    # Mock S3 client to throw error
-    mock_s3_client = MagicMock()
-    mock_boto3.client.return_value = mock_s3_client
-    mock_s3_client.head_object.side_effect = Exception("S3 connection error")
+    # The listing fails, list_s3_prefix reports it as an empty folder
+    s3_utils._prefix_cache.clear()
+    mock_s3_client.list_objects_v2.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}},
+        "ListObjectsV2",
+    )
 
     # Mock ElevenLabs and upload for fallback generation
     with patch("vocab_processor.tools.pronunciation_tool.AsyncElevenLabs"), patch(
@@ -313,4 +336,7 @@ async def test_get_pronunciation_s3_error_fallback(
     assert isinstance(response, Pronunciations)
     # Should fallback to generation when S3 check fails
     assert response.audio == "https://test-bucket.s3.amazonaws.com/fallback-audio.mp3"
+    mock_s3_client.list_objects_v2.assert_called_once_with(
+        Bucket="test-bucket", Prefix="vocabs/en/hello/audio/", MaxKeys=32
+    )
     assert response.syllables is None
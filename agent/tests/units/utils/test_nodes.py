@@ -0,0 +1,246 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from vocab_processor.constants import Language, LLMVariant, PartOfSpeech
+from vocab_processor.utils import nodes
+from vocab_processor.utils.nodes import (
+    execute_with_quality_gate,
+    node_run_parallel_tools,
+    node_validate_source_word,
+)
+from vocab_processor.utils.state import VocabState, merge_retry_counts
+from vocab_processor.utils.supervisor import TaskType, ToolValidationResult, supervisor
+from vocab_processor.utils.validation_cache import word_validation_cache
+
+
+def _state(part_of_speech: PartOfSpeech = PartOfSpeech.NOUN) -> VocabState:
+    return VocabState(
+        source_word="Haus",
+        source_language=Language.GERMAN,
+        target_word="casa",
+        target_language=Language.SPANISH,
+        target_part_of_speech=part_of_speech,
+    )
+
+
+def _tool(*results: dict) -> MagicMock:
+    """A tool whose ainvoke records a snapshot of its inputs on every call."""
+    tool = MagicMock()
+    tool.calls = []
+
+    async def ainvoke(inputs):
+        tool.calls.append(dict(inputs))
+        return SimpleNamespace(result=results[len(tool.calls) - 1], prompt="prompt")
+
+    tool.ainvoke = ainvoke
+    return tool
+
+
+def _rejected(score: float) -> ToolValidationResult:
+    return ToolValidationResult(
+        score=score, issues=["Unnatural translation"], suggestions=["Use 'casa'"]
+    )
+
+
+@pytest.mark.anyio
+async def test_execute_with_quality_gate_approves_first_try():
+    # Arrange
+    tool = _tool({"target_word": "casa"})
+    validate = AsyncMock(return_value=ToolValidationResult(score=9.0))
+
+    # Act
+    with patch.object(supervisor, "validate_tool_output", validate):
+        result = await execute_with_quality_gate(
+            _state(),
+            tool,
+            "translation",
+            TaskType.TRANSLATION,
+            {"source_word": "Haus", "llm_provider": None},
+        )
+
+    # Assert
+    assert result["target_word"] == "casa"
+    assert result["translation_quality_approved"] is True
+    assert result["translation_quality_score"] == 9.0
+    assert result["retry_counts"] == {"translation": 0}
+    assert [call["llm_provider"] for call in tool.calls] == [LLMVariant.NODE_EXECUTOR]
+
+
+@pytest.mark.anyio
+async def test_execute_with_quality_gate_retries_with_feedback_and_retry_model():
+    # Arrange
+    tool = _tool({"target_word": "a"}, {"target_word": "b"}, {"target_word": "casa"})
+    validate = AsyncMock(
+        side_effect=[_rejected(4.0), _rejected(5.0), ToolValidationResult(score=8.0)]
+    )
+
+    # Act
+    with patch.object(supervisor, "validate_tool_output", validate):
+        result = await execute_with_quality_gate(
+            _state(),
+            tool,
+            "translation",
+            TaskType.TRANSLATION,
+            {"source_word": "Haus", "llm_provider": None},
+        )
+
+    # Assert
+    assert result["target_word"] == "casa"
+    assert result["translation_quality_approved"] is True
+    assert result["retry_counts"] == {"translation": 2}
+    assert "quality_feedback" not in tool.calls[0]
+    assert tool.calls[1]["previous_issues"] == ["Unnatural translation"]
+    assert tool.calls[1]["suggestions"] == ["Use 'casa'"]
+    assert [call["llm_provider"] for call in tool.calls] == [
+        LLMVariant.NODE_EXECUTOR,
+        LLMVariant.NODE_EXECUTOR,
+        LLMVariant.SUPERVISOR,
+    ]
+
+
+@pytest.mark.anyio
+async def test_execute_with_quality_gate_falls_back_after_max_retries():
+    # Arrange
+    attempts = supervisor.max_retries + 1
+    tool = _tool(*({"target_word": "a"} for _ in range(attempts)))
+    validate = AsyncMock(return_value=_rejected(3.0))
+
+    # Act
+    with patch.object(supervisor, "validate_tool_output", validate):
+        result = await execute_with_quality_gate(
+            _state(), tool, "translation", TaskType.TRANSLATION, {"source_word": "Haus"}
+        )
+
+    # Assert
+    assert len(tool.calls) == attempts
+    assert result["translation_quality_approved"] is False
+    assert result["translation_quality_score"] == 0.0
+    assert result["target_word"].startswith("ERROR - Translation tool failed")
+    assert result["retry_counts"] == {"translation": supervisor.max_retries}
+
+
+@pytest.mark.anyio
+async def test_node_validate_source_word_hands_out_cache_copies():
+    # Arrange
+    gate = AsyncMock(
+        return_value={
+            "is_valid": True,
+            "issue_suggestions": [{"suggestion": "Haus"}],
+            "source_language": Language.GERMAN,
+            "validation_quality_approved": True,
+            "validation_quality_score": 9.0,
+            "retry_counts": {"validation": 1},
+        }
+    )
+    word_validation_cache.clear()
+
+    # Act
+    with patch.object(nodes, "execute_with_quality_gate", gate):
+        first = await node_validate_source_word(_state())
+        first["validation_suggestions"].append({"suggestion": "Hause"})
+        second = await node_validate_source_word(_state())
+    word_validation_cache.clear()
+
+    # Assert
+    gate.assert_awaited_once()
+    assert first["retry_counts"] == {"validation": 1}
+    assert second["retry_counts"] == {}
+    assert second["validation_suggestions"] == [{"suggestion": "Haus"}]
+    assert second["validation_quality_approved"] is True
+
+
+def test_merge_retry_counts_keeps_every_tool():
+    assert merge_retry_counts({"translation": 1}, {"examples": 2}) == {
+        "translation": 1,
+        "examples": 2,
+    }
+
+
+def _runners(**overrides) -> dict:
+    runners = {
+        "media": AsyncMock(
+            return_value={"media": {"url": "u"}, "retry_counts": {"media": 0}}
+        ),
+        "examples": AsyncMock(
+            return_value={"examples": ["e"], "retry_counts": {"examples": 1}}
+        ),
+        "synonyms": AsyncMock(
+            return_value={"synonyms": ["s"], "retry_counts": {"synonyms": 2}}
+        ),
+        "conjugation": AsyncMock(
+            return_value={"conjugation": "{}", "retry_counts": {"conjugation": 1}}
+        ),
+        "syllables": AsyncMock(
+            return_value={
+                "target_syllables": ["ca", "sa"],
+                "pronunciations": {"audio": "a"},
+                "retry_counts": {"syllables": 0},
+            }
+        ),
+    }
+    runners.update(overrides)
+    return runners
+
+
+@pytest.mark.anyio
+async def test_node_run_parallel_tools_skips_failed_runner():
+    # Arrange
+    runners = _runners(media=AsyncMock(side_effect=RuntimeError("Pexels down")))
+
+    # Act
+    with patch.dict(nodes._PARALLEL_TASK_RUNNERS, runners), patch.object(
+        nodes, "logger"
+    ) as mock_logger:
+        update = await node_run_parallel_tools(_state(PartOfSpeech.VERB))
+
+    # Assert
+    mock_logger.error.assert_called_once_with("media_node_failed", error="Pexels down")
+    assert "media" not in update
+    assert update["examples"] == ["e"]
+    assert update["completed_parallel_tasks"] == [
+        "examples",
+        "synonyms",
+        "syllables",
+        "conjugation",
+        "pronunciation",
+    ]
+    assert update["parallel_tasks_complete"] is True
+
+
+@pytest.mark.anyio
+async def test_node_run_parallel_tools_skips_conjugation_for_non_verbs():
+    # Arrange
+    runners = _runners()
+
+    # Act
+    with patch.dict(nodes._PARALLEL_TASK_RUNNERS, runners):
+        update = await node_run_parallel_tools(_state(PartOfSpeech.NOUN))
+
+    # Assert
+    runners["conjugation"].assert_not_awaited()
+    assert update["conjugation"] is None
+    assert update["conjugation_quality_approved"] is True
+    assert update["conjugation_quality_score"] == 10.0
+    assert "conjugation" not in update["completed_parallel_tasks"]
+    assert "pronunciation" in update["completed_parallel_tasks"]
+
+
+@pytest.mark.anyio
+async def test_node_run_parallel_tools_merges_all_retry_counts():
+    # Arrange
+    runners = _runners()
+
+    # Act
+    with patch.dict(nodes._PARALLEL_TASK_RUNNERS, runners):
+        update = await node_run_parallel_tools(_state(PartOfSpeech.VERB))
+
+    # Assert
+    assert update["retry_counts"] == {
+        "media": 0,
+        "examples": 1,
+        "synonyms": 2,
+        "conjugation": 1,
+        "syllables": 0,
+    }
@@ -1,16 +1,33 @@
+import asyncio
+import hashlib
 from unittest.mock import patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from vocab_processor.constants import Language
+from vocab_processor.utils import s3_utils
 from vocab_processor.utils.s3_utils import (
+    S3UploadError,
+    check_s3_object_exists,
     generate_english_image_s3_paths,
+    generate_safe_word_key,
     generate_vocab_s3_paths,
+    list_s3_prefix,
     upload_bytes_to_s3,
     upload_stream_to_s3,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_s3_caches():
+    s3_utils._prefix_cache.clear()
+    s3_utils._uploaded_digests.clear()
+    yield
+    s3_utils._prefix_cache.clear()
+    s3_utils._uploaded_digests.clear()
+
+
 def test_generate_vocab_s3_paths():
     # Arrange
     target_language = Language.SPANISH
@@ -20,9 +37,15 @@ def test_generate_vocab_s3_paths():
     paths = generate_vocab_s3_paths(target_language, target_word)
 
     # Assert
-    assert paths["base_prefix"] == "vocabs/es/palabra"
-    assert paths["audio_prefix"] == "vocabs/es/palabra/audio"
-    assert paths["image_prefix"] == "vocabs/es/palabra/images"
+    assert paths.base_prefix == "vocabs/es/palabra"
+    assert paths.audio_prefix == "vocabs/es/palabra/audio"
+    assert paths.image_prefix == "vocabs/es/palabra/images"
+
+
+def test_generate_safe_word_key_keeps_unicode_letters():
+    assert generate_safe_word_key("Über-größe_2!") == "Übergröße2"
+    assert generate_safe_word_key("a b", max_length=1) == "a"
+    assert generate_safe_word_key("ice-cream_2!") == "icecream2"
 
 
 def test_generate_english_image_s3_paths():
@@ -40,37 +63,100 @@ def test_generate_english_image_s3_paths():
 
 
 @pytest.mark.anyio
-@patch("vocab_processor.utils.s3_utils.is_lambda_context", return_value=True)
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
 @patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
-@patch("asyncio.to_thread")
-async def test_upload_bytes_to_s3(mock_to_thread, mock_is_lambda_context):
+@patch(
+    "vocab_processor.utils.s3_utils._S3_URL_PREFIX",
+    "https://test-bucket.s3.amazonaws.com",
+)
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_bytes_to_s3(mock_s3_client):
     # Arrange
     data = b"test data"
     s3_key = "test/key"
     content_type = "text/plain"
 
-    # Mock the asyncio.to_thread call
-    mock_to_thread.return_value = (
-        None  # S3 put_object doesn't return anything meaningful
+    # Nothing stored under the key yet
+    mock_s3_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
     )
 
     # Act
     url = await upload_bytes_to_s3(data, s3_key, content_type)
+    again = await upload_bytes_to_s3(data, s3_key, content_type)
 
     # Assert
-    assert url == "https://test-bucket.s3.amazonaws.com/test/key"
-    mock_to_thread.assert_called_once()
-    # Verify the call was made with correct parameters
-    call_args = mock_to_thread.call_args
-    assert call_args[1]["Bucket"] == "test-bucket"  # type: ignore
-    assert call_args[1]["Key"] == s3_key  # type: ignore
-    assert call_args[1]["Body"] == data  # type: ignore
-    assert call_args[1]["ContentType"] == content_type  # type: ignore
+    assert url == again == "https://test-bucket.s3.amazonaws.com/test/key"
+    mock_s3_client.head_object.assert_called_once_with(Bucket="test-bucket", Key=s3_key)
+    mock_s3_client.put_object.assert_called_once_with(
+        Bucket="test-bucket", Key=s3_key, Body=data, ContentType=content_type
+    )
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.MULTIPART_PART_SIZE", 6)
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_bytes_to_s3_uses_transfer_manager_for_large_data(
+    mock_s3_client,
+):
+    # Act
+    await upload_bytes_to_s3(b"large data", "test/key", "image/jpeg")
+
+    # Assert
+    mock_s3_client.put_object.assert_not_called()
+    mock_s3_client.head_object.assert_not_called()
+    kwargs = mock_s3_client.upload_fileobj.call_args.kwargs
+    assert kwargs["Fileobj"].getvalue() == b"large data"
+    assert kwargs["ExtraArgs"] == {"ContentType": "image/jpeg"}
+    assert kwargs["Config"] is s3_utils._TRANSFER_CONFIG
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_bytes_to_s3_skips_content_already_stored(mock_s3_client):
+    # Arrange
+    digest = hashlib.md5(b"image").hexdigest()
+    mock_s3_client.head_object.return_value = {"ETag": f'"{digest}"'}
+
+    # Act
+    url = await upload_bytes_to_s3(b"image", "test/key", "image/jpeg")
+
+    # Assert
+    assert url.endswith("/test/key")
+    mock_s3_client.head_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/key"
+    )
+    mock_s3_client.put_object.assert_not_called()
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_bytes_to_s3_uploads_when_etag_check_fails(mock_s3_client):
+    # Arrange
+    mock_s3_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadObject"
+    )
+
+    # Act
+    url = await upload_bytes_to_s3(b"image", "test/key", "image/jpeg")
+
+    # Assert
+    assert url.endswith("/test/key")
+    mock_s3_client.head_object.assert_called_once()
+    mock_s3_client.put_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/key", Body=b"image", ContentType="image/jpeg"
+    )
 
 
 @pytest.mark.anyio
-@patch("vocab_processor.utils.s3_utils.is_lambda_context", return_value=False)
-async def test_upload_bytes_to_s3_local_mode(mock_is_lambda_context):
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", False)
+async def test_upload_bytes_to_s3_local_mode():
     # Arrange
     data = b"test data"
     s3_key = "test/key"
@@ -84,8 +170,8 @@ async def test_upload_bytes_to_s3_local_mode(mock_is_lambda_context):
 
 
 @pytest.mark.anyio
-@patch("vocab_processor.utils.s3_utils.is_lambda_context", return_value=False)
-async def test_upload_stream_to_s3_local_mode(mock_is_lambda_context):
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", False)
+async def test_upload_stream_to_s3_local_mode():
     # Arrange
     async def stream():
         yield b"chunk1"
@@ -102,11 +188,9 @@ async def test_upload_stream_to_s3_local_mode(mock_is_lambda_context):
 
 
 @pytest.mark.anyio
-@patch("vocab_processor.utils.s3_utils.is_lambda_context", return_value=True)
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
 @patch("vocab_processor.utils.s3_utils.upload_bytes_to_s3")
-async def test_upload_stream_to_s3_lambda_mode(
-    mock_upload_bytes, mock_is_lambda_context
-):
+async def test_upload_stream_to_s3_lambda_mode(mock_upload_bytes):
     # Arrange
     async def stream():
         yield b"chunk1"
@@ -122,3 +206,188 @@ async def test_upload_stream_to_s3_lambda_mode(
     # Assert
     assert url == "https://test-bucket.s3.amazonaws.com/test/key"
     mock_upload_bytes.assert_called_once_with(b"chunk1chunk2", s3_key, content_type)
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch(
+    "vocab_processor.utils.s3_utils._S3_URL_PREFIX",
+    "https://test-bucket.s3.amazonaws.com",
+)
+@patch("vocab_processor.utils.s3_utils.logger")
+@patch("vocab_processor.utils.s3_utils._run_s3")
+async def test_check_s3_object_exists_missing_key(mock_run_s3, mock_logger):
+    # Arrange
+    mock_run_s3.side_effect = ClientError(
+        {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+    )
+
+    # Act
+    exists = await check_s3_object_exists("test/key")
+
+    # Assert
+    assert exists is False
+    mock_logger.error.assert_not_called()
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch(
+    "vocab_processor.utils.s3_utils._S3_URL_PREFIX",
+    "https://test-bucket.s3.amazonaws.com",
+)
+@patch("vocab_processor.utils.s3_utils.MULTIPART_PART_SIZE", 6)
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_stream_to_s3_multipart(mock_s3_client):
+    # Arrange
+    async def stream():
+        yield b"chunk1"
+        yield b"chunk2"
+        yield b"end"
+
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_s3_client.upload_part.side_effect = lambda **kwargs: {
+        "ETag": f"etag-{kwargs['PartNumber']}"
+    }
+
+    # Act
+    url = await upload_stream_to_s3(stream(), "test/key", "audio/mpeg")
+
+    # Assert
+    assert url == "https://test-bucket.s3.amazonaws.com/test/key"
+    bodies = {
+        c.kwargs["PartNumber"]: c.kwargs["Body"]
+        for c in mock_s3_client.upload_part.call_args_list
+    }
+    assert bodies == {1: b"chunk1", 2: b"chunk2", 3: b"end"}
+    mock_s3_client.complete_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket",
+        Key="test/key",
+        UploadId="upload-1",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1"},
+                {"PartNumber": 2, "ETag": "etag-2"},
+                {"PartNumber": 3, "ETag": "etag-3"},
+            ]
+        },
+    )
+    mock_s3_client.put_object.assert_not_called()
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.MULTIPART_PART_SIZE", 6)
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_stream_to_s3_multipart_splits_large_chunks(mock_s3_client):
+    # Arrange
+    async def stream():
+        yield b"abcdefghijklmn"
+
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_s3_client.upload_part.side_effect = lambda **kwargs: {
+        "ETag": f"etag-{kwargs['PartNumber']}"
+    }
+
+    # Act
+    await upload_stream_to_s3(stream(), "test/key", "audio/mpeg")
+
+    # Assert
+    bodies = {
+        c.kwargs["PartNumber"]: c.kwargs["Body"]
+        for c in mock_s3_client.upload_part.call_args_list
+    }
+    assert bodies == {1: b"abcdef", 2: b"ghijkl", 3: b"mn"}
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch(
+    "vocab_processor.utils.s3_utils._S3_URL_PREFIX",
+    "https://test-bucket.s3.amazonaws.com",
+)
+@patch("vocab_processor.utils.s3_utils.MULTIPART_PART_SIZE", 6)
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_stream_to_s3_multipart_aborts_on_error(mock_s3_client):
+    # Arrange
+    async def stream():
+        yield b"chunk1"
+        raise RuntimeError("stream broke")
+
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_s3_client.upload_part.return_value = {"ETag": "etag-1"}
+
+    # Act
+    with pytest.raises(S3UploadError):
+        await upload_stream_to_s3(stream(), "test/key", "audio/mpeg")
+
+    # Assert
+    mock_s3_client.abort_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket", Key="test/key", UploadId="upload-1"
+    )
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.MULTIPART_PART_SIZE", 6)
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_upload_stream_to_s3_multipart_aborts_on_cancel(mock_s3_client):
+    # Arrange
+    first_part_scheduled = asyncio.Event()
+
+    async def stream():
+        yield b"chunk1"
+        first_part_scheduled.set()
+        await asyncio.Event().wait()
+        yield b"never"
+
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    mock_s3_client.upload_part.return_value = {"ETag": "etag-1"}
+
+    # Act
+    upload = asyncio.create_task(
+        upload_stream_to_s3(stream(), "test/key", "audio/mpeg")
+    )
+    await first_part_scheduled.wait()
+    upload.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await upload
+
+    # Assert
+    mock_s3_client.abort_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket", Key="test/key", UploadId="upload-1"
+    )
+    mock_s3_client.complete_multipart_upload.assert_not_called()
+
+
+@pytest.mark.anyio
+@patch("vocab_processor.utils.s3_utils._IS_LAMBDA", True)
+@patch("vocab_processor.utils.s3_utils.S3_BUCKET", "test-bucket")
+@patch("vocab_processor.utils.s3_utils.s3_client")
+async def test_list_s3_prefix_is_cached_and_tracks_uploads(mock_s3_client):
+    # Arrange
+    mock_s3_client.list_objects_v2.return_value = {
+        "Contents": [{"Key": "vocabs/en/hello/audio/pronunciation.mp3"}]
+    }
+
+    # Act
+    first = await list_s3_prefix("vocabs/en/hello/audio")
+    await upload_bytes_to_s3(
+        b"data", "vocabs/en/hello/audio/syllables.mp3", "audio/mpeg"
+    )
+    second = await list_s3_prefix("vocabs/en/hello/audio/")
+
+    # Assert
+    assert first == {"vocabs/en/hello/audio/pronunciation.mp3"}
+    assert second == {
+        "vocabs/en/hello/audio/pronunciation.mp3",
+        "vocabs/en/hello/audio/syllables.mp3",
+    }
+    mock_s3_client.list_objects_v2.assert_called_once_with(
+        Bucket="test-bucket", Prefix="vocabs/en/hello/audio/", MaxKeys=32
+    )
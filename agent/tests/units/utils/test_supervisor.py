@@ -0,0 +1,130 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from vocab_processor.constants import Language, LLMVariant
+from vocab_processor.tools.conjugation_tool import CONJUGATION_ERROR_PREFIX
+from vocab_processor.utils.state import VocabState
+from vocab_processor.utils.supervisor import ToolValidationResult, VocabSupervisor
+from vocab_processor.utils.validation_cache import validation_cache
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "target_word, syllables, rejected",
+    [
+        ("casa", ["ca", "ta"], True),
+        ("la casa", ["ca", "sa"], False),
+        ("Größe", ["Grö", "ße"], False),
+        ("l'acqua", ["ac", "qua"], False),
+        ("l'acqua", ["l'ac", "qua"], False),
+        ("to run", ["run"], False),
+        ("ice cream", ["ice", "cream"], False),
+        ("hacer ejercicio", ["e", "jer", "ci", "cio"], True),
+        ("Straße", ["STRA", "SSE"], False),
+    ],
+)
+async def test_validate_syllables_rejects_misspelled_breakdowns(
+    target_word, syllables, rejected
+):
+    # Arrange
+    supervisor = VocabSupervisor()
+    state = VocabState(
+        source_word="word", target_word=target_word, target_language=Language.SPANISH
+    )
+    llm = AsyncMock(side_effect=RuntimeError("LLM unavailable"))
+
+    # Act
+    with patch("vocab_processor.utils.supervisor.create_llm_response", llm):
+        result = await supervisor.validate_tool_output(
+            "syllables",
+            {"syllables": syllables, "phonetic_guide": "guide"},
+            state,
+            "prompt",
+        )
+
+    # Assert
+    assert result.score < supervisor.quality_threshold
+    assert llm.await_count == (0 if rejected else 1)
+
+
+@pytest.mark.anyio
+async def test_validate_conjugation_rejects_tool_errors_without_llm():
+    # Arrange
+    supervisor = VocabSupervisor()
+    state = VocabState(
+        source_word="run", target_word="correr", target_language=Language.SPANISH
+    )
+    llm = AsyncMock()
+
+    # Act
+    with patch("vocab_processor.utils.supervisor.create_llm_response", llm):
+        result = await supervisor.validate_tool_output(
+            "conjugation",
+            {"result": f"{CONJUGATION_ERROR_PREFIX}: timeout"},
+            state,
+            "",
+        )
+
+    # Assert
+    assert result.score == 0.0
+    llm.assert_not_awaited()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "first_score, providers",
+    [
+        (9.0, [LLMVariant.NODE_EXECUTOR]),
+        (8.0, [LLMVariant.NODE_EXECUTOR, LLMVariant.SUPERVISOR]),
+        (7.0, [LLMVariant.NODE_EXECUTOR, LLMVariant.SUPERVISOR]),
+        (3.0, [LLMVariant.NODE_EXECUTOR]),
+    ],
+)
+async def test_validate_tool_output_escalates_unsure_checks(first_score, providers):
+    # Arrange
+    supervisor = VocabSupervisor()
+    state = VocabState(
+        source_word="Baum", target_word="tree", target_language=Language.ENGLISH
+    )
+    llm = AsyncMock(
+        side_effect=[
+            ToolValidationResult(score=first_score),
+            ToolValidationResult(score=9.5),
+        ]
+    )
+
+    # Act
+    with patch("vocab_processor.utils.supervisor.create_llm_response", llm):
+        result = await supervisor.validate_tool_output(
+            "translation", {"target_word": "tree"}, state, "prompt"
+        )
+    validation_cache.clear()
+
+    # Assert
+    assert [call.kwargs["llm_provider"] for call in llm.await_args_list] == providers
+    assert result.score == (first_score if len(providers) == 1 else 9.5)
+
+
+@pytest.mark.anyio
+async def test_validate_media_accepts_retrieved_photos_without_llm():
+    # Arrange
+    supervisor = VocabSupervisor()
+    state = VocabState(
+        source_word="Baum", target_word="tree", target_language=Language.ENGLISH
+    )
+    src = {
+        size: f"https://images.pexels.com/{size}.jpg"
+        for size in ("large2x", "large", "medium")
+    }
+    llm = AsyncMock()
+
+    # Act
+    with patch("vocab_processor.utils.supervisor.create_llm_response", llm):
+        result = await supervisor.validate_tool_output(
+            "media", {"media": {"src": src}}, state, "prompt"
+        )
+
+    # Assert
+    assert result.score == 10.0
+    llm.assert_not_awaited()
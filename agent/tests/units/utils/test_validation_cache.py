@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from vocab_processor.constants import Language
+from vocab_processor.utils.core_utils import TTLCache
+from vocab_processor.utils.state import VocabState
+from vocab_processor.utils.supervisor import ToolValidationResult, VocabSupervisor
+from vocab_processor.utils.validation_cache import make_cache_key, validation_cache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    # Arrange
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Act
+    cache.get("a")
+    cache.set("c", 3)
+
+    # Assert
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    # Arrange
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    with patch("vocab_processor.utils.core_utils.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+
+    # Act / Assert
+    with patch("vocab_processor.utils.core_utils.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+def test_make_cache_key_ignores_key_order():
+    assert make_cache_key({"a": 1, "b": [1, 2]}) == make_cache_key(
+        {"b": [1, 2], "a": 1}
+    )
+    assert make_cache_key({"a": 1}) != make_cache_key({"a": 2})
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("score, expected_calls", [(9.0, 1), (3.0, 2)])
+async def test_validate_tool_output_reuses_only_approvals(score, expected_calls):
+    # Arrange
+    validation_cache.clear()
+    supervisor = VocabSupervisor()
+    state = VocabState(
+        source_word="Haus", target_word="house", target_language=Language.ENGLISH
+    )
+    llm = AsyncMock(side_effect=lambda **_: ToolValidationResult(score=score))
+
+    # Act
+    with patch("vocab_processor.utils.supervisor.create_llm_response", llm):
+        first = await supervisor.validate_tool_output(
+            "translation", {"target_word": "house"}, state, "prompt"
+        )
+        second = await supervisor.validate_tool_output(
+            "translation", {"target_word": "house"}, state, "prompt"
+        )
+    validation_cache.clear()
+
+    # Assert
+    assert first.score == second.score == score
+    assert llm.await_count == expected_calls
+    assert second is not first
@@ -1,18 +1,11 @@
 from langgraph.graph import END, StateGraph
 
 from vocab_processor.utils.nodes import (
-    join_parallel_tasks,
     node_get_classification,
-    node_get_conjugation,
-    node_get_examples,
-    node_get_media,
-    node_get_pronunciation,
-    node_get_syllables,
-    node_get_synonyms,
     node_get_translation,
+    node_run_parallel_tools,
     node_validate_source_word,
     supervisor_check_sequential_quality,
-    supervisor_coordinate_parallel_tasks,
     supervisor_final_quality_check,
 )
 from vocab_processor.utils.state import VocabState
@@ -49,19 +42,7 @@ def should_proceed_to_parallel_tasks(state: VocabState) -> str:
     If quality checks passed, proceeds to parallel tasks. Otherwise, ends the graph.
     """
     if state.sequential_quality_passed is True:
-        return "supervisor_coordinate_parallel_tasks"
-    else:
-        return END
-
-
-# Conditional function to decide when to proceed to final quality check
-def should_proceed_to_final_quality_check(state: VocabState) -> str:
-    """
-    Determines whether to proceed to final quality check based on task completion.
-    If all tasks are complete, proceeds to final quality check. Otherwise, continues join loop.
-    """
-    if state.parallel_tasks_complete is True:
-        return "supervisor_final_quality_check"
+        return "run_parallel_tools"
     else:
         return END
 
@@ -79,19 +60,10 @@ def build_vocab_graph():
     workflow.add_node(
         "supervisor_check_sequential_quality", supervisor_check_sequential_quality
     )
-    workflow.add_node(
-        "supervisor_coordinate_parallel_tasks", supervisor_coordinate_parallel_tasks
-    )
-    workflow.add_node("join_parallel_tasks", join_parallel_tasks)
     workflow.add_node("supervisor_final_quality_check", supervisor_final_quality_check)
 
-    # Add parallel processing nodes
-    workflow.add_node("get_media", node_get_media)
-    workflow.add_node("get_examples", node_get_examples)
-    workflow.add_node("get_synonyms", node_get_synonyms)
-    workflow.add_node("get_conjugation", node_get_conjugation)
-    workflow.add_node("get_syllables", node_get_syllables)
-    workflow.add_node("get_pronunciation", node_get_pronunciation)
+    # Add parallel processing node
+    workflow.add_node("run_parallel_tools", node_run_parallel_tools)
 
     # Define graph structure
     workflow.set_entry_point("validate_source_word")
@@ -116,38 +88,12 @@ def build_vocab_graph():
     workflow.add_conditional_edges(
         "supervisor_check_sequential_quality",
         should_proceed_to_parallel_tasks,
-        {
-            "supervisor_coordinate_parallel_tasks": "supervisor_coordinate_parallel_tasks",
-            END: END,
-        },
+        {"run_parallel_tools": "run_parallel_tools", END: END},
     )
 
-    # Parallel task execution
-    workflow.add_edge("supervisor_coordinate_parallel_tasks", "get_media")
-    workflow.add_edge("supervisor_coordinate_parallel_tasks", "get_examples")
-    workflow.add_edge("supervisor_coordinate_parallel_tasks", "get_synonyms")
-    workflow.add_edge("supervisor_coordinate_parallel_tasks", "get_conjugation")
-    workflow.add_edge("supervisor_coordinate_parallel_tasks", "get_syllables")
-
-    # Pronunciation depends on syllables
-    workflow.add_edge("get_syllables", "get_pronunciation")
-
-    # All parallel tasks feed into join node that tracks completion
-    workflow.add_edge("get_media", "join_parallel_tasks")
-    workflow.add_edge("get_examples", "join_parallel_tasks")
-    workflow.add_edge("get_synonyms", "join_parallel_tasks")
-    workflow.add_edge("get_conjugation", "join_parallel_tasks")
-    workflow.add_edge("get_pronunciation", "join_parallel_tasks")
-
-    # Join node conditionally proceeds to final quality check only when all tasks complete
-    workflow.add_conditional_edges(
-        "join_parallel_tasks",
-        should_proceed_to_final_quality_check,
-        {
-            "supervisor_final_quality_check": "supervisor_final_quality_check",
-            END: END,
-        },
-    )
+    # Media, examples, synonyms, conjugation, syllables and pronunciation
+    # run concurrently in one node, then hand off to the final quality check
+    workflow.add_edge("run_parallel_tools", "supervisor_final_quality_check")
 
     # Final quality check ends the workflow
     workflow.add_edge("supervisor_final_quality_check", END)
@@ -1,5 +1,9 @@
 from typing import Optional
 
+from aws_lambda_powertools import Logger
+
+logger = Logger(service="vocab-processor")
+
 
 def add_quality_feedback_to_prompt(
     base_prompt: str,
@@ -35,12 +39,11 @@ def add_quality_feedback_to_prompt(
             )
 
     if suggestions or previous_issues:
-        print()
-        print("ISSUESS DETECTED" + "-" * 100)
-        print(suggestions)
-        print(previous_issues)
-        print("-" * 100)
-        print()
+        logger.debug(
+            "Retry prompt includes quality feedback",
+            previous_issues=previous_issues,
+            suggestions=suggestions,
+        )
 
     return base_prompt + requirements_section + feedback_section
 
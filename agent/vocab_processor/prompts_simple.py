@@ -1,5 +1,9 @@
 from typing import Optional
 
+from aws_lambda_powertools import Logger
+
+logger = Logger(service="vocab-processor")
+
 
 def add_quality_feedback_to_prompt(
     full_prompt: str,
@@ -27,14 +31,12 @@ def add_quality_feedback_to_prompt(
             f"\n**MUST FOLLOW THESE INSTRUCTION SET:**\n{suggestions_text}\n"
         )
 
-    # Add debug printing like in original prompts.py
     if suggestions or previous_issues:
-        print()
-        print("ISSUES DETECTED" + "-" * 100)
-        print(suggestions)
-        print(previous_issues)
-        print("-" * 100)
-        print()
+        logger.debug(
+            "Retry prompt includes quality feedback",
+            previous_issues=previous_issues,
+            suggestions=suggestions,
+        )
 
     return full_prompt + feedback_section
 
@@ -13,6 +13,9 @@ from vocab_processor.tools.base_tool import (
     create_tool_error_response,
 )
 
+# Prefix of the result returned when the conjugation table could not be created
+CONJUGATION_ERROR_PREFIX = "Error creating conjugation"
+
 
 def _get_expected_tenses_for_language(target_language: Language) -> str:
     """Extract expected tenses from schema modules and format for prompt."""
@@ -109,6 +112,6 @@ async def get_conjugation(
         }
         error_response = create_tool_error_response(e, context)
         return ConjugationResponse(
-            result=f"Error creating conjugation: {error_response}",
+            result=f"{CONJUGATION_ERROR_PREFIX}: {error_response}",
             prompt="",
         )
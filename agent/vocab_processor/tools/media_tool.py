@@ -24,6 +24,7 @@ from vocab_processor.utils.ddb_utils import (
     normalize_word,
 )
 from vocab_processor.utils.s3_utils import (
+    S3UploadError,
     generate_english_image_s3_paths,
     is_lambda_context,
     upload_bytes_to_s3,
@@ -165,6 +166,9 @@ async def upload_to_s3(url: str, s3_key: str) -> str:
                     raise RuntimeError(
                         f"Failed to download image: HTTP {response.status}"
                     )
+    except S3UploadError as e:
+        # Already logged with its traceback by the S3 helper
+        return f"Error: {str(e)}"
     except Exception as e:
         logger.error("image_download_failed", url=url, s3_key=s3_key, error=str(e))
         return f"Error: {str(e)}"
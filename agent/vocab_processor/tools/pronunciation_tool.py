@@ -3,7 +3,6 @@ import os
 import random
 from typing import Optional
 
-import boto3
 from aws_lambda_powertools import Logger
 from elevenlabs import VoiceSettings
 from elevenlabs.client import AsyncElevenLabs
@@ -13,7 +12,13 @@ from pydantic import BaseModel, Field
 from vocab_processor.constants import Language
 from vocab_processor.tools.base_tool import create_tool_error_response
 from vocab_processor.utils.core_utils import is_lambda_context
-from vocab_processor.utils.s3_utils import generate_vocab_s3_paths, upload_stream_to_s3
+from vocab_processor.utils.s3_utils import (
+    S3UploadError,
+    generate_s3_url,
+    generate_vocab_s3_paths,
+    list_s3_prefix,
+    upload_stream_to_s3,
+)
 
 # Audio file constants
 AUDIO_FILENAMES = {"pronunciation": "pronunciation.mp3", "syllables": "syllables.mp3"}
@@ -161,53 +166,24 @@ async def _check_existing_audio_in_s3(
         # In local dev mode, always return None to force generation of mock URLs
         return {"audio": None, "syllables": None}
 
-    try:
-        s3_client = boto3.client("s3")
-        bucket_name = os.getenv("S3_MEDIA_BUCKET_NAME")
+    # Create centralized audio paths
+    audio_paths = AudioPaths(audio_prefix)
 
-        if not bucket_name:
-            logger.error(
-                "S3_MEDIA_BUCKET_NAME not set, cannot check for existing audio"
-            )
-            return {"audio": None, "syllables": None}
+    # One listing of the audio folder answers for both files
+    existing_keys = await list_s3_prefix(audio_prefix)
 
-        # Create centralized audio paths
-        audio_paths = AudioPaths(audio_prefix)
+    audio_url = None
+    if audio_paths.pronunciation_key in existing_keys:
+        audio_url = generate_s3_url(audio_paths.pronunciation_key)
+        logger.info(f"Found existing audio file: {audio_paths.pronunciation_key}")
 
-        # Check if pronunciation.mp3 exists
-        audio_url = None
-        try:
-            s3_client.head_object(Bucket=bucket_name, Key=audio_paths.pronunciation_key)
-            audio_url = audio_paths.get_s3_url(bucket_name, "pronunciation")
-            logger.info(f"Found existing audio file: {audio_paths.pronunciation_key}")
-        except s3_client.exceptions.NoSuchKey:
-            logger.info(f"Audio file not found: {audio_paths.pronunciation_key}")
-        except Exception as e:
-            logger.warning(
-                f"Error checking audio file {audio_paths.pronunciation_key}: {str(e)}"
-            )
+    # Only look for syllables.mp3 if we need it
+    syllables_url = None
+    if len(target_syllables) > 1 and audio_paths.syllables_key in existing_keys:
+        syllables_url = generate_s3_url(audio_paths.syllables_key)
+        logger.info(f"Found existing syllables file: {audio_paths.syllables_key}")
 
-        # Check if syllables.mp3 exists (only if we need it)
-        syllables_url = None
-        if len(target_syllables) > 1:
-            try:
-                s3_client.head_object(Bucket=bucket_name, Key=audio_paths.syllables_key)
-                syllables_url = audio_paths.get_s3_url(bucket_name, "syllables")
-                logger.info(
-                    f"Found existing syllables file: {audio_paths.syllables_key}"
-                )
-            except s3_client.exceptions.NoSuchKey:
-                logger.info(f"Syllables file not found: {audio_paths.syllables_key}")
-            except Exception as e:
-                logger.warning(
-                    f"Error checking syllables file {audio_paths.syllables_key}: {str(e)}"
-                )
-
-        return {"audio": audio_url, "syllables": syllables_url}
-
-    except Exception as e:
-        logger.error(f"Error checking existing audio files: {str(e)}")
-        return {"audio": None, "syllables": None}
+    return {"audio": audio_url, "syllables": syllables_url}
 
 
 class AudioPaths:
@@ -218,15 +194,6 @@ class AudioPaths:
         self.pronunciation_key = f"{audio_prefix}/{AUDIO_FILENAMES['pronunciation']}"
         self.syllables_key = f"{audio_prefix}/{AUDIO_FILENAMES['syllables']}"
 
-    def get_s3_url(self, bucket_name: str, file_type: str) -> str:
-        """Generate S3 URL for a given file type."""
-        key = (
-            self.pronunciation_key
-            if file_type == "pronunciation"
-            else self.syllables_key
-        )
-        return f"https://{bucket_name}.s3.amazonaws.com/{key}"
-
     def get_mock_url(self, file_type: str) -> str:
         """Generate mock URL for local development."""
         key = (
@@ -250,8 +217,9 @@ async def get_pronunciation(
         language_code = target_language.code
 
         # Generate S3 paths using centralized utility
-        s3_paths = generate_vocab_s3_paths(target_language, target_word)
-        audio_prefix = s3_paths["audio_prefix"]
+        audio_prefix = generate_vocab_s3_paths(
+            target_language, target_word
+        ).audio_prefix
 
         # Create centralized audio paths
         audio_paths = AudioPaths(audio_prefix)
@@ -278,7 +246,6 @@ async def get_pronunciation(
         if existing_audio["audio"] and (
             not syllables_needed or existing_audio["syllables"]
         ):
-            print("existing_audio", existing_audio)
             logger.info(f"Reusing existing audio files for {target_word}")
             return Pronunciations(
                 audio=existing_audio["audio"], syllables=existing_audio["syllables"]
@@ -327,29 +294,38 @@ async def get_pronunciation(
                 return f"ERROR: Audio generation failed for {text}, {file_type}, {'text' if not is_syllables else 'syllables'}"
 
             # Upload stream directly to S3
-            return await upload_stream_to_s3(audio_generator, s3_key, "audio/mpeg")
-
-        # Generate word pronunciation (only if it doesn't exist)
+            try:
+                return await upload_stream_to_s3(audio_generator, s3_key, "audio/mpeg")
+            except S3UploadError:
+                logger.warning(f"Audio upload failed for {text}, using fallback URL")
+                return f"ERROR: Audio upload failed for {text}, {file_type}"
+
+        # Word and syllables audio are independent, generate and upload the
+        # missing ones concurrently
+        audio_task = None
         if existing_audio["audio"]:
             audio_url = existing_audio["audio"]
             logger.info(f"Reusing existing audio file for {target_word}")
         else:
-            audio_url = await generate_and_upload_audio(
-                target_word,
-                "pronunciation",
-            )
+            audio_task = generate_and_upload_audio(target_word, "pronunciation")
 
-        # Generate syllables audio if provided and more than one syllable (only if it doesn't exist)
+        # Syllables audio is only needed for more than one syllable
         syllables_url = None
+        syllables_task = None
         if len(target_syllables) > 1:
             if existing_audio["syllables"]:
                 syllables_url = existing_audio["syllables"]
                 logger.info(f"Reusing existing syllables file for {target_word}")
             else:
                 syllables_text = "\n\n".join(target_syllables)
-                syllables_url = await generate_and_upload_audio(
-                    syllables_text, "syllables"
-                )
+                syllables_task = generate_and_upload_audio(syllables_text, "syllables")
+
+        if audio_task and syllables_task:
+            audio_url, syllables_url = await asyncio.gather(audio_task, syllables_task)
+        elif audio_task:
+            audio_url = await audio_task
+        elif syllables_task:
+            syllables_url = await syllables_task
 
         if is_lambda_context():
             logger.info(
@@ -1,6 +1,12 @@
+import json
 import os
 import re
+import time
 import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import orjson
 
 
 def is_lambda_context() -> bool:
@@ -23,3 +29,76 @@ def normalize_word(word: str) -> str:
         if unicodedata.category(ch) != "Mn"
     )
     return _NORMALISE_RGX.sub("", word)
+
+
+def dumps_json(
+    obj: Any,
+    default: Callable[[Any], Any] = str,
+    indent: bool = False,
+    sort_keys: bool = False,
+) -> str:
+    """Serialize to a JSON string with orjson.
+
+    With ``indent`` the output is pretty-printed with two spaces, with
+    ``sort_keys`` object keys are sorted for a canonical form.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=default, option=option).decode()
+    except orjson.JSONEncodeError:
+        # Only for what orjson can't encode, e.g. integers wider than 64 bits;
+        # formatted like orjson so the text stays the same shape
+        return json.dumps(
+            obj,
+            default=default,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+        )
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds.
+
+    Reads and writes never await, so the cache is safe to share between
+    coroutines running on the same event loop.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -94,7 +94,8 @@ class VocabProcessRequestDto(BaseModel):
 
 def lang_code(lang_enum) -> str:
     """Return iso code for Language enum, falling back to .value."""
-    return getattr(lang_enum, "code", str(lang_enum.value).lower())
+    code = getattr(lang_enum, "code", None)
+    return code if code is not None else str(lang_enum.value).lower()
 
 
 def _get_pos_category(part_of_speech_value: str) -> str:
@@ -492,7 +493,7 @@ async def store_result(result: dict[str, Any], req: VocabProcessRequestDto):
     # Prepare search words for individual entries
     search_query = result.get("search_query", [])
     normalized_search_words = [
-        normalize_word(word) for word in search_query if word.strip()
+        normalize_word(word) for word in search_query if word and not word.isspace()
     ]
 
     item: dict[str, Any] = {
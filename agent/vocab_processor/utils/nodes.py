@@ -1,4 +1,8 @@
-import json
+import asyncio
+import copy
+import logging
+from functools import lru_cache
+from typing import Optional
 
 from aws_lambda_powertools import Logger
 
@@ -13,120 +17,215 @@ from vocab_processor.tools import (
     get_translation,
     validate_word,
 )
+from vocab_processor.utils.core_utils import dumps_json
 from vocab_processor.utils.state import VocabState
 from vocab_processor.utils.supervisor import LLMRouter, TaskType, supervisor
+from vocab_processor.utils.validation_cache import (
+    word_validation_cache,
+    word_validation_key,
+)
 
 logger = Logger(service="vocab-processor")
 logger.setLevel("ERROR")
 
+# (approved field, score field, step name) for every quality-gated step
+_QUALITY_PAIRS = tuple(
+    (f"{step}_quality_approved", f"{step}_quality_score", step)
+    for step in (
+        "validation",
+        "classification",
+        "translation",
+        "media",
+        "examples",
+        "synonyms",
+        "syllables",
+        "conjugation",
+    )
+)
+
+# State fields passed as inputs to each tool
+_WORD_CHECK_INPUT_FIELDS = (
+    "source_word",
+    "source_language",
+    "target_language",
+)
+_TRANSLATION_INPUT_FIELDS = (
+    "source_word",
+    "source_language",
+    "target_language",
+    "source_part_of_speech",
+)
+_SYNONYMS_INPUT_FIELDS = (
+    "target_word",
+    "source_language",
+    "target_language",
+    "target_part_of_speech",
+)
+_SYLLABLES_INPUT_FIELDS = (
+    "target_word",
+    "target_language",
+)
+_MEDIA_INPUT_FIELDS = (
+    "source_word",
+    "target_word",
+    "english_word",
+    "source_language",
+    "target_language",
+    "source_definition",
+    "target_additional_info",
+)
+_EXAMPLES_INPUT_FIELDS = (
+    "source_word",
+    "target_word",
+    "source_language",
+    "target_language",
+    "source_part_of_speech",
+    "target_part_of_speech",
+)
+_CONJUGATION_INPUT_FIELDS = (
+    "target_word",
+    "target_language",
+    "target_part_of_speech",
+)
+
+
+def _inputs_from_state(state: VocabState, fields: tuple[str, ...]) -> dict:
+    """Build tool inputs from the given state fields."""
+    return {field: getattr(state, field) for field in fields}
+
+
+def _model_dump(result) -> dict:
+    return result.model_dump()
+
+
+def _instance_dict(result) -> dict:
+    return result.__dict__
+
+
+def _as_is(result) -> dict:
+    return result
+
+
+def _wrap_result(result) -> dict:
+    return {"result": result}
+
+
+@lru_cache(maxsize=64)
+def _converter_for(result_type: type):
+    """Pick the dict conversion for a result type once and reuse it."""
+    if hasattr(result_type, "model_dump"):
+        return _model_dump
+    if result_type.__dictoffset__:
+        return _instance_dict
+    if issubclass(result_type, dict):
+        return _as_is
+    return _wrap_result
+
 
 def _convert_to_dict(result: any) -> dict:
     """Convert a Pydantic model or other object to a dictionary."""
-    if hasattr(result, "model_dump"):
-        return result.model_dump()
-    if hasattr(result, "__dict__"):
-        return result.__dict__
-    if isinstance(result, dict):
-        return result
-    return {"result": result}
+    return _converter_for(type(result))(result)
 
 
 def _create_quality_result(
-    result_dict: dict, tool_name: str, approved: bool, score: float
+    result_dict: dict,
+    tool_name: str,
+    approved: bool,
+    score: float,
+    retry_count: int = 0,
 ) -> dict:
-    """Create standardized quality result with tool-specific approval and score."""
+    """Create standardized quality result with tool-specific approval, score and retries."""
     return {
         **result_dict,
         f"{tool_name}_quality_approved": approved,
         f"{tool_name}_quality_score": score,
+        "retry_counts": {tool_name: retry_count},
     }
 
 
-def _create_fallback_result(tool_name: str, inputs: dict, error_msg: str) -> dict:
+def _create_fallback_result(
+    tool_name: str, inputs: dict, error_msg: str, retry_count: int = 0
+) -> dict:
     """Create fallback result for failed tools."""
     from vocab_processor.utils.supervisor import create_fallback_result
 
     fallback = create_fallback_result(tool_name, inputs, error_msg)
-    return _create_quality_result(fallback, tool_name, False, 0.0)
+    return _create_quality_result(fallback, tool_name, False, 0.0, retry_count)
 
 
 async def execute_with_quality_gate(
-    state: VocabState, tool_func, tool_name: str, task_type: TaskType, inputs: dict
+    state: VocabState,
+    tool_func,
+    tool_name: str,
+    task_type: TaskType,
+    inputs: dict,
+    retry_count: Optional[int] = None,
 ) -> dict:
-    """Execute a tool with supervisor quality control and retry logic."""
-
-    # Get current retry count
-    retry_count_field = f"{tool_name}_retry_count"
-    retry_count = getattr(state, retry_count_field, 0)
+    """Execute a tool with supervisor quality control and retry logic.
 
-    # Select appropriate model
-    llm_model = LLMRouter.get_model_for_task(task_type, retry_count)
+    The number of retries used is returned under ``retry_counts[tool_name]`` so
+    nodes can hand it back to the graph state.
+    """
 
-    # Add model selection to inputs if supported
-    if "llm_provider" in inputs:
-        inputs["llm_provider"] = llm_model
+    # Start from the given retry count, or the one already recorded in state
+    if retry_count is None:
+        retry_count = state.retry_counts.get(tool_name, 0)
 
     try:
-        # Execute the tool
-        response = await tool_func.ainvoke(inputs)
+        while True:
+            # Select appropriate model
+            llm_model = LLMRouter.get_model_for_task(task_type, retry_count)
 
-        result = getattr(response, "result", response)
-        prompt = getattr(response, "prompt", None)
-        result_dict = _convert_to_dict(result)
+            # Add model selection to inputs if supported
+            if "llm_provider" in inputs:
+                inputs["llm_provider"] = llm_model
 
-        # Validate result quality
-        validation_result = await supervisor.validate_tool_output(
-            tool_name, result_dict, state, prompt
-        )
-
-        print()
-        print("-" * 100)
-        print("tool_name", tool_name)
-        print("result_dict", result_dict)
-        print("validation_result", validation_result)
-        print("-" * 100)
-        print()
+            # Execute the tool
+            response = await tool_func.ainvoke(inputs)
 
-        # Log quality results efficiently
-        logger.info(
-            f"{tool_name}_quality_check",
-            score=validation_result.score,
-            issues_count=len(validation_result.issues),
-            retry_count=retry_count,
-        )
+            result = getattr(response, "result", response)
+            prompt = getattr(response, "prompt", None)
+            result_dict = _convert_to_dict(result)
 
-        # Check if quality meets threshold
-        quality_passed = validation_result.score >= supervisor.quality_threshold
+            # Validate result quality
+            validation_result = await supervisor.validate_tool_output(
+                tool_name, result_dict, state, prompt
+            )
 
-        if quality_passed:
-            return _create_quality_result(
-                result_dict, tool_name, True, validation_result.score
+            # Log quality results efficiently
+            logger.info(
+                f"{tool_name}_quality_check",
+                score=validation_result.score,
+                issues_count=len(validation_result.issues),
+                retry_count=retry_count,
             )
 
-        # Quality failed, plan retry
-        retry_strategy = await supervisor.plan_retry_strategy(
-            tool_name, validation_result, state
-        )
+            # Check if quality meets threshold
+            quality_passed = validation_result.score >= supervisor.quality_threshold
+
+            if quality_passed:
+                return _create_quality_result(
+                    result_dict, tool_name, True, validation_result.score, retry_count
+                )
 
-        if retry_strategy.should_retry:
-            # Increment retry count and retry
-            updated_state = state.model_copy()
-            setattr(updated_state, retry_count_field, retry_count + 1)
+            # Quality failed, plan retry
+            retry_strategy = await supervisor.plan_retry_strategy(
+                tool_name, validation_result, state, retry_count=retry_count
+            )
+
+            if not retry_strategy.should_retry:
+                break
 
-            # Apply adjusted inputs
-            adjusted_inputs = {**inputs, **retry_strategy.adjusted_inputs}
+            # Increment retry count and apply adjusted inputs for the next attempt
+            retry_count += 1
+            inputs = {**inputs, **retry_strategy.adjusted_inputs}
 
             logger.info(
                 f"{tool_name}_retry",
-                retry_count=retry_count + 1,
+                retry_count=retry_count,
                 reason=retry_strategy.retry_reason,
             )
 
-            # Recursive retry with adjusted inputs
-            return await execute_with_quality_gate(
-                updated_state, tool_func, tool_name, task_type, adjusted_inputs
-            )
-
         # Max retries reached, return failure
         logger.error(
             f"{tool_name}_max_retries_reached",
@@ -135,19 +234,17 @@ async def execute_with_quality_gate(
         )
 
         error_msg = f"Quality threshold not met after {supervisor.max_retries} retries"
-        return _create_fallback_result(tool_name, inputs, error_msg)
+        return _create_fallback_result(tool_name, inputs, error_msg, retry_count)
 
     except Exception as e:
         logger.error(
             f"{tool_name}_execution_failed",
             error=(
-                json.dumps(_convert_to_dict(e), default=str)
-                if hasattr(e, "__dict__")
-                else str(e)
+                dumps_json(_convert_to_dict(e)) if hasattr(e, "__dict__") else str(e)
             ),
             retry_count=retry_count,
         )
-        return _create_fallback_result(tool_name, inputs, str(e))
+        return _create_fallback_result(tool_name, inputs, str(e), retry_count)
 
 
 async def execute_without_quality_gate(tool_func, tool_name: str, inputs: dict) -> dict:
@@ -158,13 +255,6 @@ async def execute_without_quality_gate(tool_func, tool_name: str, inputs: dict)
         response = await tool_func.ainvoke(inputs)
         result_dict = _convert_to_dict(getattr(response, "result", response))
 
-        print()
-        print("-" * 100)
-        print("tool_name", tool_name)
-        print("result_dict", result_dict)
-        print("-" * 100)
-        print()
-
         logger.info(msg=f"{tool_name}_executed_successfully")
 
         return result_dict
@@ -173,9 +263,7 @@ async def execute_without_quality_gate(tool_func, tool_name: str, inputs: dict)
         logger.error(
             f"{tool_name}_execution_failed",
             error=(
-                json.dumps(_convert_to_dict(e), default=str)
-                if hasattr(e, "__dict__")
-                else str(e)
+                dumps_json(_convert_to_dict(e)) if hasattr(e, "__dict__") else str(e)
             ),
         )
         return _create_fallback_result(tool_name, inputs, str(e))
@@ -184,22 +272,36 @@ async def execute_without_quality_gate(tool_func, tool_name: str, inputs: dict)
 async def node_validate_source_word(state: VocabState) -> VocabState:
     """Validate the source word and run it through the quality gate, regardless of validity."""
 
-    inputs = {
-        "source_word": state.source_word,
-        "source_language": state.source_language,
-        "target_language": state.target_language,
-    }
+    inputs = _inputs_from_state(state, _WORD_CHECK_INPUT_FIELDS)
 
     try:
-        # Always run through the quality gate
-        quality_result = await execute_with_quality_gate(
-            state, validate_word, "validation", TaskType.VALIDATION, inputs
+        # Always run through the quality gate, unless this word was already approved
+        cache_key = word_validation_key(
+            state.source_word, state.source_language, state.target_language
         )
+        cached = word_validation_cache.get(cache_key)
+        if cached is not None:
+            # Callers may mutate the result, so never hand out the cached dict
+            quality_result = copy.deepcopy(cached)
+        else:
+            quality_result = await execute_with_quality_gate(
+                state, validate_word, "validation", TaskType.VALIDATION, inputs
+            )
+            if quality_result.get("validation_quality_approved"):
+                # Retries belong to the run that paid for them, not to cache hits
+                word_validation_cache.set(
+                    cache_key,
+                    copy.deepcopy(
+                        {k: v for k, v in quality_result.items() if k != "retry_counts"}
+                    ),
+                )
 
         is_valid = quality_result.get("is_valid", False)
         error_message = quality_result.get("issue_message")
         suggestions = quality_result.get("issue_suggestions")
         source_language = quality_result.get("source_language")
+        quality_approved = quality_result.get("validation_quality_approved", False)
+        quality_score = quality_result.get("validation_quality_score", 0.0)
 
         logger.info(
             "validation_result_with_quality",
@@ -208,8 +310,8 @@ async def node_validate_source_word(state: VocabState) -> VocabState:
             source_language=str(source_language) if source_language else None,
             validation_message=error_message,
             suggestions_count=len(suggestions) if suggestions else 0,
-            quality_approved=quality_result.get("validation_quality_approved", False),
-            quality_score=quality_result.get("validation_quality_score", 0.0),
+            quality_approved=quality_approved,
+            quality_score=quality_score,
         )
 
         # Structure the return state
@@ -218,12 +320,9 @@ async def node_validate_source_word(state: VocabState) -> VocabState:
             "source_language": source_language,
             "validation_issue": error_message,
             "validation_suggestions": suggestions,
-            "validation_quality_approved": quality_result.get(
-                "validation_quality_approved", False
-            ),
-            "validation_quality_score": quality_result.get(
-                "validation_quality_score", 0.0
-            ),
+            "validation_quality_approved": quality_approved,
+            "validation_quality_score": quality_score,
+            "retry_counts": quality_result.get("retry_counts", {}),
         }
 
     except Exception as e:
@@ -239,30 +338,14 @@ async def node_validate_source_word(state: VocabState) -> VocabState:
 
 async def node_get_classification(state: VocabState) -> VocabState:
     """Classify the source word for part of speech and definitions, then check if it exists."""
-    inputs = {
-        "source_word": state.source_word,
-        "source_language": state.source_language,
-        "target_language": state.target_language,
-    }
+    inputs = _inputs_from_state(state, _WORD_CHECK_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_classification, "classification", TaskType.CLASSIFICATION, inputs
     )
 
-    logger.debug(
-        "classification_result",
-        source_word=result.get("source_word"),
-        source_definition=result.get("source_definition"),
-        source_part_of_speech=result.get("source_part_of_speech"),
-        source_article=result.get("source_article"),
-        word_exists=result.get("word_exists", False),
-        word_processing=result.get("word_processing", False),
-        quality_approved=result.get("classification_quality_approved", False),
-        quality_score=result.get("classification_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "source_word": result.get("source_word"),
         "source_definition": result.get("source_definition"),
         "source_part_of_speech": result.get("source_part_of_speech"),
@@ -275,35 +358,35 @@ async def node_get_classification(state: VocabState) -> VocabState:
             "classification_quality_approved", False
         ),
         "classification_quality_score": result.get("classification_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
     }
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "classification_result",
+            source_word=update["source_word"],
+            source_definition=update["source_definition"],
+            source_part_of_speech=update["source_part_of_speech"],
+            source_article=update["source_article"],
+            word_exists=update["word_exists"],
+            word_processing=update["word_processing"],
+            quality_approved=update["classification_quality_approved"],
+            quality_score=update["classification_quality_score"],
+        )
+
+    return update
+
 
 async def node_get_translation(state: VocabState) -> VocabState:
     """Translate the word to the target language."""
-    inputs = {
-        "source_word": state.source_word,
-        "source_language": state.source_language,
-        "target_language": state.target_language,
-        "source_part_of_speech": state.source_part_of_speech,
-    }
+    inputs = _inputs_from_state(state, _TRANSLATION_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_translation, "translation", TaskType.TRANSLATION, inputs
     )
 
-    logger.debug(
-        "translation_result",
-        word=state.source_word,
-        target_word=result.get("target_word"),
-        target_part_of_speech=result.get("target_part_of_speech"),
-        target_article=result.get("target_article"),
-        target_plural_form=result.get("target_plural_form"),
-        quality_approved=result.get("translation_quality_approved", False),
-        quality_score=result.get("translation_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "target_word": result.get("target_word"),
         "target_part_of_speech": result.get("target_part_of_speech"),
         "target_article": result.get("target_article"),
@@ -314,8 +397,23 @@ async def node_get_translation(state: VocabState) -> VocabState:
             "translation_quality_approved", False
         ),
         "translation_quality_score": result.get("translation_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
     }
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "translation_result",
+            word=state.source_word,
+            target_word=update["target_word"],
+            target_part_of_speech=update["target_part_of_speech"],
+            target_article=update["target_article"],
+            target_plural_form=update["target_plural_form"],
+            quality_approved=update["translation_quality_approved"],
+            quality_score=update["translation_quality_score"],
+        )
+
+    return update
+
 
 async def node_get_synonyms(state: VocabState) -> VocabState:
     """Fetch synonyms for the word."""
@@ -327,61 +425,61 @@ async def node_get_synonyms(state: VocabState) -> VocabState:
             "synonyms_quality_score": 10.0,
         }
 
-    inputs = {
-        "target_word": state.target_word,
-        "source_language": state.source_language,
-        "target_language": state.target_language,
-        "target_part_of_speech": state.target_part_of_speech,
-    }
+    inputs = _inputs_from_state(state, _SYNONYMS_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_synonyms, "synonyms", TaskType.SYNONYMS, inputs
     )
 
-    logger.debug(
-        "synonyms_result",
-        word=state.target_word,
-        synonyms=result.get("synonyms", []),
-        quality_approved=result.get("synonyms_quality_approved", False),
-        quality_score=result.get("synonyms_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "synonyms": result.get("synonyms", []),
         "synonyms_quality_approved": result.get("synonyms_quality_approved", False),
         "synonyms_quality_score": result.get("synonyms_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
     }
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "synonyms_result",
+            word=state.target_word,
+            synonyms=update["synonyms"],
+            quality_approved=update["synonyms_quality_approved"],
+            quality_score=update["synonyms_quality_score"],
+        )
+
+    return update
+
 
 async def node_get_syllables(state: VocabState) -> VocabState:
     """Generate syllable breakdown for the target word."""
-    inputs = {
-        "target_word": state.target_word,
-        "target_language": state.target_language,
-    }
+    inputs = _inputs_from_state(state, _SYLLABLES_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_syllables, "syllables", TaskType.SYLLABLES, inputs
     )
 
-    logger.debug(
-        "syllables_result",
-        word=state.target_word,
-        syllables=result.get("syllables", []),
-        phonetic_guide=result.get("phonetic_guide", ""),
-        quality_approved=result.get("syllables_quality_approved", False),
-        quality_score=result.get("syllables_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "target_syllables": result.get("syllables", []),
         "syllables_quality_approved": result.get("syllables_quality_approved", False),
         "target_phonetic_guide": result.get("phonetic_guide", ""),
         "syllables_quality_score": result.get("syllables_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
     }
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "syllables_result",
+            word=state.target_word,
+            syllables=update["target_syllables"],
+            phonetic_guide=update["target_phonetic_guide"],
+            quality_approved=update["syllables_quality_approved"],
+            quality_score=update["syllables_quality_score"],
+        )
+
+    return update
+
 
 async def node_get_pronunciation(state: VocabState) -> VocabState:
     """Get pronunciation audio for the word."""
@@ -396,11 +494,12 @@ async def node_get_pronunciation(state: VocabState) -> VocabState:
         get_pronunciation, "pronunciation", inputs
     )
 
-    logger.debug(
-        "pronunciation_result",
-        word=state.target_word,
-        pronunciations=result,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "pronunciation_result",
+            word=state.target_word,
+            pronunciations=result,
+        )
 
     return {
         "pronunciations": result,
@@ -409,32 +508,14 @@ async def node_get_pronunciation(state: VocabState) -> VocabState:
 
 async def node_get_media(state: VocabState) -> VocabState:
     """Get visual media for the word."""
-    inputs = {
-        "source_word": state.source_word,
-        "target_word": state.target_word,
-        "english_word": state.english_word,
-        "source_language": state.source_language,
-        "target_language": state.target_language,
-        "source_definition": state.source_definition,
-        "target_additional_info": state.target_additional_info,
-    }
+    inputs = _inputs_from_state(state, _MEDIA_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_media, "media", TaskType.MEDIA_SELECTION, inputs
     )
 
-    logger.debug(
-        "media_result",
-        word=state.source_word,
-        media=result.get("media", None),
-        search_query=result.get("search_query", []),
-        media_reused=result.get("media_reused", False),
-        quality_approved=result.get("media_quality_approved", False),
-        quality_score=result.get("media_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "media": result.get("media", None),
         "media_ref": result.get("media_ref", None),
         "search_query": result.get("search_query", []),
@@ -442,74 +523,152 @@ async def node_get_media(state: VocabState) -> VocabState:
         "media_adapted": result.get("media_adapted", False),
         "media_quality_approved": result.get("media_quality_approved", False),
         "media_quality_score": result.get("media_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
     }
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "media_result",
+            word=state.source_word,
+            media=update["media"],
+            search_query=update["search_query"],
+            media_reused=update["media_reused"],
+            quality_approved=update["media_quality_approved"],
+            quality_score=update["media_quality_score"],
+        )
+
+    return update
+
 
 async def node_get_examples(state: VocabState) -> VocabState:
     """Generate example sentences."""
-    inputs = {
-        "source_word": state.source_word,
-        "target_word": state.target_word,
-        "source_language": state.source_language,
-        "target_language": state.target_language,
-        "source_part_of_speech": state.source_part_of_speech,
-        "target_part_of_speech": state.target_part_of_speech,
-    }
+    inputs = _inputs_from_state(state, _EXAMPLES_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_examples, "examples", TaskType.EXAMPLES, inputs
     )
 
-    logger.debug(
-        "examples_result",
-        word=state.source_word,
-        examples=result.get("examples", []),
-        quality_approved=result.get("examples_quality_approved", False),
-        quality_score=result.get("examples_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "examples": result.get("examples", []),
         "examples_quality_approved": result.get("examples_quality_approved", False),
         "examples_quality_score": result.get("examples_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
     }
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "examples_result",
+            word=state.source_word,
+            examples=update["examples"],
+            quality_approved=update["examples_quality_approved"],
+            quality_score=update["examples_quality_score"],
+        )
 
-async def node_get_conjugation(state: VocabState) -> VocabState:
-    """Get verb conjugation if applicable."""
-    if not state.target_part_of_speech.is_conjugatable:
-        return {
-            "conjugation": None,
-            "conjugation_quality_approved": True,
-            "conjugation_quality_score": 10.0,
-        }
+    return update
 
-    inputs = {
-        "target_word": state.target_word,
-        "target_language": state.target_language,
-        "target_part_of_speech": state.target_part_of_speech,
-    }
+
+async def node_get_conjugation(state: VocabState) -> VocabState:
+    """Get verb conjugation, only scheduled for conjugatable parts of speech."""
+    inputs = _inputs_from_state(state, _CONJUGATION_INPUT_FIELDS)
 
     # Execute with quality gate
     result = await execute_with_quality_gate(
         state, get_conjugation, "conjugation", TaskType.CONJUGATION, inputs
     )
 
-    logger.debug(
-        "conjugation_result",
-        word=state.target_word,
-        conjugation=result.get("result", None),
-        quality_approved=result.get("conjugation_quality_approved", False),
-        quality_score=result.get("conjugation_quality_score", 0.0),
-    )
-
-    return {
+    update = {
         "conjugation": result.get("result", None),
         "conjugation_quality_approved": result.get(
             "conjugation_quality_approved", False
         ),
         "conjugation_quality_score": result.get("conjugation_quality_score", 0.0),
+        "retry_counts": result.get("retry_counts", {}),
+    }
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "conjugation_result",
+            word=state.target_word,
+            conjugation=update["conjugation"],
+            quality_approved=update["conjugation_quality_approved"],
+            quality_score=update["conjugation_quality_score"],
+        )
+
+    return update
+
+
+async def _run_syllables_then_pronunciation(state: VocabState) -> VocabState:
+    """Generate syllables first, since pronunciation audio is built from them."""
+    syllables_result = await node_get_syllables(state)
+
+    pronunciation_state = state.model_copy(
+        update={"target_syllables": syllables_result.get("target_syllables")}
+    )
+    pronunciation_result = await node_get_pronunciation(pronunciation_state)
+
+    return {**syllables_result, **pronunciation_result}
+
+
+# Tools run concurrently after translation, pronunciation is chained after syllables
+_PARALLEL_TASK_RUNNERS = {
+    "media": node_get_media,
+    "examples": node_get_examples,
+    "synonyms": node_get_synonyms,
+    "conjugation": node_get_conjugation,
+    "syllables": _run_syllables_then_pronunciation,
+}
+
+# State update for words whose part of speech has no conjugation
+_SKIPPED_CONJUGATION_RESULT = {
+    "conjugation": None,
+    "conjugation_quality_approved": True,
+    "conjugation_quality_score": 10.0,
+}
+
+
+async def node_run_parallel_tools(state: VocabState) -> VocabState:
+    """Run all applicable post-translation tools concurrently and merge their state updates."""
+
+    parallel_tasks = await supervisor.coordinate_parallel_tasks(state)
+    scheduled_tasks = [
+        task for task in parallel_tasks if task in _PARALLEL_TASK_RUNNERS
+    ]
+
+    logger.info("parallel_tasks_coordination", tasks=parallel_tasks)
+
+    results = await asyncio.gather(
+        *(_PARALLEL_TASK_RUNNERS[task](state) for task in scheduled_tasks),
+        return_exceptions=True,
+    )
+
+    merged = {}
+    if "conjugation" not in scheduled_tasks:
+        merged.update(_SKIPPED_CONJUGATION_RESULT)
+
+    completed_tasks = []
+    retry_counts = {}
+    for task_name, result in zip(scheduled_tasks, results):
+        if isinstance(result, BaseException):
+            logger.error(f"{task_name}_node_failed", error=str(result))
+            continue
+        # Each task reports its own retry count, keep all of them
+        retry_counts.update(result.get("retry_counts", {}))
+        merged.update(result)
+        completed_tasks.append(task_name)
+
+    # Pronunciation is chained after syllables and reported as its own task
+    if merged.get("pronunciations") is not None:
+        completed_tasks.append("pronunciation")
+
+    logger.info("parallel_tasks_complete", completed_tasks=completed_tasks)
+
+    return {
+        **merged,
+        "retry_counts": retry_counts,
+        "parallel_tasks_to_execute": parallel_tasks,
+        "completed_parallel_tasks": completed_tasks,
+        "parallel_tasks_complete": True,
     }
 
 
@@ -545,134 +704,35 @@ async def supervisor_check_sequential_quality(state: VocabState) -> VocabState:
         }
 
 
-async def supervisor_coordinate_parallel_tasks(state: VocabState) -> VocabState:
-    """Supervisor coordinates and validates parallel task execution."""
-
-    # Determine which parallel tasks should be executed
-    parallel_tasks = await supervisor.coordinate_parallel_tasks(state)
-
-    logger.info("parallel_tasks_coordination", tasks=parallel_tasks)
-
-    return {"parallel_tasks_to_execute": parallel_tasks}
-
-
 async def supervisor_final_quality_check(state: VocabState) -> VocabState:
     """Final quality check before completing the vocabulary processing."""
 
     # Check all quality gates
-    quality_fields = [
-        "validation_quality_approved",
-        "classification_quality_approved",
-        "translation_quality_approved",
-        "media_quality_approved",
-        "examples_quality_approved",
-        "synonyms_quality_approved",
-        "syllables_quality_approved",
-        "conjugation_quality_approved",
-    ]
-
-    quality_scores = []
+    total_score = 0.0
+    passed_checks = 0
     failed_quality_checks = []
 
-    for field in quality_fields:
-        approved = getattr(state, field, False)
-        score_field = field.replace("_approved", "_score")
-        score = getattr(state, score_field, 0.0)
-
-        if approved:
-            quality_scores.append(score)
+    for approved_field, score_field, step_name in _QUALITY_PAIRS:
+        if getattr(state, approved_field, False):
+            total_score += getattr(state, score_field, 0.0)
+            passed_checks += 1
         else:
-            failed_quality_checks.append(field.replace("_quality_approved", ""))
+            failed_quality_checks.append(step_name)
 
     # Calculate overall quality score
-    overall_quality = (
-        sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
-    )
+    overall_quality = total_score / passed_checks if passed_checks else 0.0
 
     logger.info(
         "final_quality_assessment",
         overall_quality=overall_quality,
-        passed_checks=len(quality_scores),
+        passed_checks=passed_checks,
         failed_checks=len(failed_quality_checks),
         failed_quality_checks=failed_quality_checks,
     )
 
     return {
         "overall_quality_score": overall_quality,
-        "quality_checks_passed": len(quality_scores),
+        "quality_checks_passed": passed_checks,
         "quality_checks_failed": len(failed_quality_checks),
         "processing_complete": True,
     }
-
-
-async def join_parallel_tasks(state: VocabState) -> VocabState:
-    """Join node that tracks completed parallel tasks and triggers final quality check when all are done."""
-
-    # Get the list of completed tasks from state (initialize if not exists or None)
-    completed_tasks = getattr(state, "completed_parallel_tasks", []) or []
-
-    # Determine which task just completed by checking which quality fields are set
-    parallel_tasks = ["media", "examples", "syllables"]
-
-    # Add conjugation if it's a verb
-    if state.target_part_of_speech and state.target_part_of_speech.is_conjugatable:
-        parallel_tasks.append("conjugation")
-
-    # Add synonyms if the word has synonyms
-    if state.target_part_of_speech and state.target_part_of_speech.has_synonyms:
-        parallel_tasks.append("synonyms")
-
-    # Add pronunciation
-    parallel_tasks.append("pronunciation")
-
-    # Find newly completed tasks (tasks that have quality approval but aren't in completed list)
-    newly_completed = []
-    for task in parallel_tasks:
-        if task == "pronunciation":
-            # Pronunciation is complete if it has pronunciations data (no quality gate)
-            if hasattr(state, "pronunciations") and state.pronunciations is not None:
-                if task not in completed_tasks:
-                    newly_completed.append(task)
-        else:
-            # Other tasks need quality approval
-            quality_field = f"{task}_quality_approved"
-            if (
-                hasattr(state, quality_field)
-                and getattr(state, quality_field, None) is not None
-                and task not in completed_tasks
-            ):
-                newly_completed.append(task)
-
-    # Add newly completed tasks to the list
-    updated_completed_tasks = list(set(completed_tasks + newly_completed))
-
-    # Log the current state
-    logger.info(
-        "join_parallel_tasks",
-        newly_completed=newly_completed,
-        total_completed=len(updated_completed_tasks),
-        expected_total=len(parallel_tasks),
-        completed_tasks=updated_completed_tasks,
-        expected_tasks=parallel_tasks,
-    )
-
-    # Check if all expected parallel tasks are complete
-    all_complete = set(updated_completed_tasks) >= set(parallel_tasks)
-
-    if all_complete:
-        logger.info(
-            "join_parallel_tasks",
-            status="All parallel tasks complete, proceeding to final quality check",
-        )
-        return {
-            "completed_parallel_tasks": updated_completed_tasks,
-            "parallel_tasks_complete": True,
-        }
-    else:
-        logger.info(
-            "join_parallel_tasks", status="Waiting for more parallel tasks to complete"
-        )
-        return {
-            "completed_parallel_tasks": updated_completed_tasks,
-            "parallel_tasks_complete": False,
-        }
@@ -1,46 +1,129 @@
 import asyncio
+import hashlib
+import io
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import AsyncIterator, NamedTuple, Optional
 
 import boto3
 from aws_lambda_powertools import Logger
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from vocab_processor.constants import Language
-from vocab_processor.utils.core_utils import is_lambda_context
+from vocab_processor.utils.core_utils import TTLCache, is_lambda_context
 
 logger = Logger(service="vocab-processor")
 
 S3_BUCKET = os.getenv("S3_MEDIA_BUCKET_NAME")
 
+# Resolved once per cold start, the environment does not change afterwards
+_IS_LAMBDA = is_lambda_context()
+if _IS_LAMBDA and not S3_BUCKET:
+    # Fail the cold start instead of handing out https://None.s3... URLs
+    raise ValueError("S3_MEDIA_BUCKET_NAME environment variable not set")
+_S3_URL_PREFIX = f"https://{S3_BUCKET}.s3.amazonaws.com"
+_MOCK_URL_PREFIX = "https://mock-s3-bucket.local"
+
+# Maximum number of concurrent S3 requests, shared by the client pool and executor
+S3_MAX_CONCURRENCY = 128
+
 # Initialize S3 client with optimized configuration
 s3_client = boto3.client(
     "s3",
     region_name=os.getenv("AWS_REGION", "us-east-1"),
-    config=boto3.session.Config(
-        max_pool_connections=50,  # Increase connection pool
-        retries={"max_attempts": 3, "mode": "adaptive"},
+    config=Config(
+        max_pool_connections=S3_MAX_CONCURRENCY,  # Increase connection pool
+        tcp_keepalive=True,  # Keep pooled connections alive between uploads
+        retries={"max_attempts": 5, "mode": "adaptive"},
     ),
 )
 
+# Blocking S3 calls get their own threads, so slow uploads never occupy the
+# default executor that asyncio.to_thread and DynamoDB calls rely on
+_s3_executor = ThreadPoolExecutor(
+    max_workers=S3_MAX_CONCURRENCY, thread_name_prefix="s3-io"
+)
+
+
+async def _run_s3(method, **kwargs):
+    """Run a blocking S3 client method on the dedicated S3 executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_s3_executor, partial(method, **kwargs))
+
+
+# Everything str.isalnum() rejects: non-word characters plus the underscore
+_NON_ALNUM_RGX = re.compile(r"[\W_]+")
+
+# Deletion table for the ASCII characters str.isalnum() rejects
+_ASCII_NON_ALNUM_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not chr(i).isalnum())
+)
+
+# Multipart part size (S3 needs at least 5 MiB for all but the last part) and
+# the number of parts uploaded concurrently
+MULTIPART_PART_SIZE = 16 * 1024 * 1024
+MULTIPART_MAX_IN_FLIGHT = 8
 
+# Same part sizing for in-memory payloads handed to the transfer manager
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_PART_SIZE,
+    multipart_chunksize=MULTIPART_PART_SIZE,
+    max_concurrency=MULTIPART_MAX_IN_FLIGHT,
+    use_threads=True,
+)
+
+
+class S3UploadError(RuntimeError):
+    """Raised when an object could not be uploaded to S3."""
+
+
+# Error codes returned by head_object for a missing key
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+# Recent prefix listings, a word folder only ever holds a handful of files
+_prefix_cache = TTLCache(maxsize=1024, ttl=300)
+_LIST_PREFIX_MAX_KEYS = 32
+
+# MD5 of the single-part bytes last uploaded or found per key by this process
+_uploaded_digests = TTLCache(maxsize=2048, ttl=3600)
+
+
+@lru_cache(maxsize=8192)
 def generate_safe_word_key(word: str, max_length: int = 20) -> str:
     """Generate a safe string for use in file paths from a word."""
-    return "".join(c for c in word if c.isalnum())[:max_length]
+    # Most words have nothing to strip, str.isalnum checks that in one C call
+    if word.isalnum():
+        return word[:max_length]
+    if word.isascii():
+        return word.translate(_ASCII_NON_ALNUM_TABLE)[:max_length]
+    return _NON_ALNUM_RGX.sub("", word)[:max_length]
+
 
+class S3Paths(NamedTuple):
+    """Standardized S3 prefixes for one vocabulary word."""
 
-def generate_vocab_s3_paths(
-    target_language: Language, target_word: str
-) -> dict[str, str]:
+    base_prefix: str
+    audio_prefix: str
+    image_prefix: str
+
+
+@lru_cache(maxsize=4096)
+def generate_vocab_s3_paths(target_language: Language, target_word: str) -> S3Paths:
     """
     Generate standardized S3 paths for vocabulary content.
     """
     safe_target = generate_safe_word_key(target_word)
     base_prefix = f"vocabs/{target_language.code}/{safe_target}"
 
-    return {
-        "base_prefix": base_prefix,
-        "audio_prefix": f"{base_prefix}/audio",
-        "image_prefix": f"{base_prefix}/images",
-    }
+    return S3Paths(
+        base_prefix=base_prefix,
+        audio_prefix=f"{base_prefix}/audio",
+        image_prefix=f"{base_prefix}/images",
+    )
 
 
 def generate_english_image_s3_paths(english_word: str) -> dict[str, str]:
@@ -66,78 +149,293 @@ async def check_s3_object_exists(s3_key: str) -> bool:
     Returns:
         True if object exists, False otherwise
     """
-    if not is_lambda_context():
+    if not _IS_LAMBDA:
         logger.info(f"Local dev mode: skipping S3 existence check for {s3_key}")
         return False
 
     try:
-        await asyncio.to_thread(s3_client.head_object, Bucket=S3_BUCKET, Key=s3_key)
+        await _run_s3(s3_client.head_object, Bucket=S3_BUCKET, Key=s3_key)
         return True
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in _NOT_FOUND_CODES:
+            logger.error(f"Error checking S3 object existence: {e}")
+        return False
     except Exception as e:
         logger.error(f"Error checking S3 object existence: {e}")
         return False
 
 
+async def list_s3_prefix(prefix: str) -> frozenset[str]:
+    """
+    List the object keys directly under a prefix with a single request.
+
+    Returns:
+        Keys found under the prefix, empty in local mode or on errors
+    """
+    if not _IS_LAMBDA:
+        logger.info(f"Local dev mode: skipping S3 listing for {prefix}")
+        return frozenset()
+
+    prefix = prefix.rstrip("/") + "/"
+    cached = _prefix_cache.get(prefix)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await _run_s3(
+            s3_client.list_objects_v2,
+            Bucket=S3_BUCKET,
+            Prefix=prefix,
+            MaxKeys=_LIST_PREFIX_MAX_KEYS,
+        )
+    except Exception as e:
+        logger.error(f"Error listing S3 prefix {prefix}: {e}")
+        return frozenset()
+
+    keys = frozenset(obj["Key"] for obj in response.get("Contents", []))
+    _prefix_cache.set(prefix, keys)
+    return keys
+
+
+def _mark_uploaded(s3_key: str) -> None:
+    """Record a freshly uploaded key in the prefix cache."""
+    prefix = s3_key.rpartition("/")[0] + "/"
+    cached = _prefix_cache.get(prefix)
+    if cached is not None:
+        _prefix_cache.set(prefix, cached | {s3_key})
+
+
 def generate_s3_url(s3_key: str) -> str:
     """Generate S3 URL from key."""
-    if not is_lambda_context():
-        return f"https://mock-s3-bucket.local/{s3_key}"
-    return f"https://{S3_BUCKET}.s3.amazonaws.com/{s3_key}"
+    if not _IS_LAMBDA:
+        return f"{_MOCK_URL_PREFIX}/{s3_key}"
+    return f"{_S3_URL_PREFIX}/{s3_key}"
 
 
-async def upload_bytes_to_s3(data: bytes, s3_key: str, content_type: str) -> str:
+def _md5_hex(data: bytes | bytearray) -> str:
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+async def _stored_etag_matches(s3_key: str, digest: str) -> bool:
+    """Whether the stored object's ETag equals the digest, False if unknown."""
+    try:
+        head = await _run_s3(s3_client.head_object, Bucket=S3_BUCKET, Key=s3_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in _NOT_FOUND_CODES:
+            # Only an optimisation, the upload goes ahead without it
+            logger.warning(f"ETag check failed for {s3_key}, uploading anyway: {e}")
+        return False
+    except Exception as e:
+        logger.warning(f"ETag check failed for {s3_key}, uploading anyway: {e}")
+        return False
+    return head.get("ETag", "").strip('"') == digest
+
+
+async def upload_bytes_to_s3(
+    data: bytes | bytearray, s3_key: str, content_type: str
+) -> str:
     """
     Upload bytes directly to S3.
     In local development mode, returns a mock URL without performing actual upload.
 
     Returns:
         S3 URL or mock URL in local mode
+
+    Raises:
+        S3UploadError: If the upload fails
     """
-    if not is_lambda_context():
+    if not _IS_LAMBDA:
         logger.info(
             f"Local dev mode: skipping S3 upload for {s3_key} ({len(data)} bytes, {content_type})"
         )
-        return f"https://mock-s3-bucket.local/{s3_key}"
+        return f"{_MOCK_URL_PREFIX}/{s3_key}"
+
+    s3_url = f"{_S3_URL_PREFIX}/{s3_key}"
+    try:
+        if len(data) < MULTIPART_PART_SIZE:
+            # Regenerated media is often byte-identical to what is already
+            # stored. Single-part ETags are the MD5 of the body, so a HEAD
+            # detects that, also across invocations, and saves the PUT.
+            digest = await _run_s3(_md5_hex, data=data)
+            if _uploaded_digests.get(s3_key) == digest or await _stored_etag_matches(
+                s3_key, digest
+            ):
+                _uploaded_digests.set(s3_key, digest)
+                return s3_url
+
+            await _run_s3(
+                s3_client.put_object,
+                Bucket=S3_BUCKET,
+                Key=s3_key,
+                Body=data,
+                ContentType=content_type,
+            )
+            _uploaded_digests.set(s3_key, digest)
+        else:
+            # Large payloads go through the transfer manager, which splits them
+            # into parts and uploads those on its own worker threads. Their
+            # multipart ETag is not a plain MD5, so there is nothing to compare.
+            await _run_s3(
+                s3_client.upload_fileobj,
+                Fileobj=io.BytesIO(data),
+                Bucket=S3_BUCKET,
+                Key=s3_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_TRANSFER_CONFIG,
+            )
+
+        _mark_uploaded(s3_key)
+        return s3_url
+    except Exception as e:
+        logger.exception("Error uploading to S3", s3_key=s3_key)
+        raise S3UploadError(f"Error uploading to S3: {s3_key}") from e
+
 
+async def _upload_part(
+    s3_key: str,
+    upload_id: str,
+    part_number: int,
+    data: bytes,
+    semaphore: asyncio.Semaphore,
+) -> dict:
+    """Upload one part of a multipart upload and return its completion entry."""
     try:
-        await asyncio.to_thread(
-            s3_client.put_object,
+        response = await _run_s3(
+            s3_client.upload_part,
             Bucket=S3_BUCKET,
             Key=s3_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
             Body=data,
-            ContentType=content_type,
         )
+    finally:
+        semaphore.release()
+    return {"PartNumber": part_number, "ETag": response["ETag"]}
 
-        return f"https://{S3_BUCKET}.s3.amazonaws.com/{s3_key}"
-    except Exception as e:
-        logger.error(f"Error uploading to S3: {e}")
-        return f"Error uploading to S3: {str(e)}"
+
+async def _collect_stream(
+    data_stream, part_size: int
+) -> AsyncIterator[bytes | bytearray]:
+    """
+    Re-chunk a byte stream into blocks of exactly part_size bytes.
+    Chunks are appended to one bytearray and each full block is copied out
+    through a memoryview before its prefix is dropped in place, so the stream is
+    never concatenated as bytes. The final block may be shorter.
+    """
+    buffer = bytearray()
+    async for chunk in data_stream:
+        buffer.extend(chunk)
+        while len(buffer) >= part_size:
+            with memoryview(buffer) as view, view[:part_size] as part:
+                block = bytes(part)
+            del buffer[:part_size]
+            yield block
+
+    if buffer:
+        # Nothing else touches the buffer anymore, hand it over without copying
+        yield buffer
+
+
+async def _abort_multipart_upload(
+    s3_key: str, upload_id: Optional[str], part_tasks: list[asyncio.Task]
+) -> None:
+    """Cancel pending part uploads and abort the multipart upload, if started."""
+    for task in part_tasks:
+        task.cancel()
+    await asyncio.gather(*part_tasks, return_exceptions=True)
+    if upload_id is None:
+        return
+    try:
+        await _run_s3(
+            s3_client.abort_multipart_upload,
+            Bucket=S3_BUCKET,
+            Key=s3_key,
+            UploadId=upload_id,
+        )
+    except Exception:
+        logger.exception(
+            "Error aborting multipart upload", s3_key=s3_key, upload_id=upload_id
+        )
 
 
 async def upload_stream_to_s3(data_stream, s3_key: str, content_type: str) -> str:
     """
     Upload streaming data directly to S3.
+    Streams larger than one part are sent as a multipart upload whose parts are
+    uploaded concurrently while the rest of the stream is still being received;
+    smaller streams fall back to a single put_object.
     In local development mode, returns a mock URL without performing actual upload.
 
     Returns:
         S3 URL or mock URL in local mode
+
+    Raises:
+        S3UploadError: If the upload fails
     """
-    if not is_lambda_context():
+    if not _IS_LAMBDA:
         logger.info(
             f"Local dev mode: skipping S3 stream upload for {s3_key} ({content_type})"
         )
-        return f"https://mock-s3-bucket.local/{s3_key}"
+        return f"{_MOCK_URL_PREFIX}/{s3_key}"
+
+    upload_id = None
+    part_tasks: list[asyncio.Task] = []
+    # Bounds the parts held in memory and in flight; reading the stream pauses
+    # until a slot frees up
+    semaphore = asyncio.Semaphore(MULTIPART_MAX_IN_FLIGHT)
+
+    async def schedule_part(data: bytes) -> None:
+        await semaphore.acquire()
+        part_tasks.append(
+            asyncio.create_task(
+                _upload_part(s3_key, upload_id, len(part_tasks) + 1, data, semaphore)
+            )
+        )
 
     try:
-        # Collect stream data
-        chunks = []
-        async for chunk in data_stream:
-            chunks.append(chunk)
+        async for block in _collect_stream(data_stream, MULTIPART_PART_SIZE):
+            # Only the last block can be short, so a short first block means the
+            # whole stream fit into one part and a plain put_object is cheaper
+            if upload_id is None and len(block) < MULTIPART_PART_SIZE:
+                return await upload_bytes_to_s3(block, s3_key, content_type)
 
-        # Combine chunks and upload
-        data = b"".join(chunks)
-        return await upload_bytes_to_s3(data, s3_key, content_type)
+            if upload_id is None:
+                response = await _run_s3(
+                    s3_client.create_multipart_upload,
+                    Bucket=S3_BUCKET,
+                    Key=s3_key,
+                    ContentType=content_type,
+                )
+                upload_id = response["UploadId"]
 
-    except Exception as e:
-        logger.error(f"Error uploading stream to S3: {e}")
-        return f"Error uploading stream to S3: {str(e)}"
+            await schedule_part(block)
+
+        # Empty stream
+        if upload_id is None:
+            return await upload_bytes_to_s3(b"", s3_key, content_type)
+
+        # gather keeps the parts in PartNumber order
+        parts = await asyncio.gather(*part_tasks)
+
+        await _run_s3(
+            s3_client.complete_multipart_upload,
+            Bucket=S3_BUCKET,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+        _mark_uploaded(s3_key)
+        return f"{_S3_URL_PREFIX}/{s3_key}"
+
+    except S3UploadError:
+        # Single put_object path, already logged by upload_bytes_to_s3
+        raise
+    except BaseException as e:
+        # Also on cancellation (e.g. a Lambda timeout), otherwise the part
+        # uploads keep running detached and S3 keeps the orphaned parts
+        await _abort_multipart_upload(s3_key, upload_id, part_tasks)
+        if not isinstance(e, Exception):
+            raise
+        logger.exception("Error uploading stream to S3", s3_key=s3_key)
+        raise S3UploadError(f"Error uploading stream to S3: {s3_key}") from e
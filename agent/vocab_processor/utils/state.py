@@ -1,6 +1,6 @@
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from vocab_processor.constants import Language, PartOfSpeech
 from vocab_processor.schemas.media_model import Media
@@ -10,7 +10,19 @@ from vocab_processor.tools.synonyms_tool import Synonym
 from vocab_processor.tools.validation_tool import SuggestedWordInfo
 
 
+def merge_retry_counts(left: dict[str, int], right: dict[str, int]) -> dict[str, int]:
+    """Reducer that keeps the retry counts reported by every tool."""
+    return {**left, **right}
+
+
 class VocabState(BaseModel):
+    # Nodes only read state and return partial updates, so skip assignment validation
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        validate_assignment=False,
+        extra="ignore",
+    )
+
     # Inputs from user
     source_word: str = Field(..., description="The initial word provided by the user.")
     source_language: Optional[Language] = Field(
@@ -154,15 +166,10 @@ class VocabState(BaseModel):
         None, description="Whether conjugation step passed quality gate."
     )
 
-    # Retry counts for each tool
-    validation_retry_count: Optional[int] = Field(default=0)
-    classification_retry_count: Optional[int] = Field(default=0)
-    translation_retry_count: Optional[int] = Field(default=0)
-    media_retry_count: Optional[int] = Field(default=0)
-    examples_retry_count: Optional[int] = Field(default=0)
-    synonyms_retry_count: Optional[int] = Field(default=0)
-    syllables_retry_count: Optional[int] = Field(default=0)
-    conjugation_retry_count: Optional[int] = Field(default=0)
+    # Retry counts for each tool, merged across node updates
+    retry_counts: Annotated[dict[str, int], merge_retry_counts] = Field(
+        default_factory=dict, description="Retries used per quality-gated tool."
+    )
 
     # Quality scores for monitoring
     validation_quality_score: Optional[float] = Field(None)
@@ -188,6 +195,3 @@ class VocabState(BaseModel):
     quality_checks_passed: Optional[int] = Field(None)
     quality_checks_failed: Optional[int] = Field(None)
     processing_complete: Optional[bool] = Field(None)
-
-    class Config:
-        arbitrary_types_allowed = True
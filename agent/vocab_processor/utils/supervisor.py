@@ -1,6 +1,9 @@
-import json
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from string import Template
+from types import MappingProxyType
+from typing import Any, Callable, Optional
 
 from aws_lambda_powertools import Logger
 from pydantic import BaseModel, Field
@@ -9,7 +12,10 @@ from vocab_processor.constants import LLMVariant
 from vocab_processor.schemas.media_model import SearchQueryResult
 from vocab_processor.tools.base_tool import SystemMessages, create_llm_response
 from vocab_processor.tools.classification_tool import WordClassification
-from vocab_processor.tools.conjugation_tool import ConjugationResponse
+from vocab_processor.tools.conjugation_tool import (
+    CONJUGATION_ERROR_PREFIX,
+    ConjugationResponse,
+)
 from vocab_processor.tools.examples_tool import Examples
 from vocab_processor.tools.syllables_tool import SyllableBreakdown
 from vocab_processor.tools.synonyms_tool import Synonyms
@@ -17,7 +23,9 @@ from vocab_processor.tools.translation_tool import Translation
 
 # Import actual Pydantic models for schema-aware validation
 from vocab_processor.tools.validation_tool import WordValidationResult
+from vocab_processor.utils.core_utils import dumps_json
 from vocab_processor.utils.state import VocabState
+from vocab_processor.utils.validation_cache import tool_validation_key, validation_cache
 
 logger = Logger(service="vocab-processor-supervisor")
 
@@ -51,70 +59,298 @@ class ToolValidationResult(BaseModel):
     )
 
 
-class RetryStrategy(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RetryStrategy:
     """Strategy for retrying failed tools."""
 
-    should_retry: bool = Field(...)
-    retry_reason: str = Field(...)
-    adjusted_inputs: dict[str, Any] = Field(default={})
+    should_retry: bool
+    retry_reason: str
+    adjusted_inputs: dict[str, Any] = field(default_factory=dict)
+
+
+# Shared outcomes for the no-retry exits, their inputs are read-only so the
+# instances can't be altered by a caller
+_NO_RETRY_QUALITY_MET = RetryStrategy(
+    should_retry=False,
+    retry_reason="Score meets quality threshold",
+    adjusted_inputs=MappingProxyType({}),
+)
+_NO_RETRY_FINAL_ACCEPTABLE = RetryStrategy(
+    should_retry=False,
+    retry_reason="Final retry with acceptable score (>= 7.0)",
+    adjusted_inputs=MappingProxyType({}),
+)
+_NO_RETRY_MAX_REACHED = RetryStrategy(
+    should_retry=False,
+    retry_reason="Maximum retries reached",
+    adjusted_inputs=MappingProxyType({}),
+)
+
+
+# Routine tool execution tasks, run on the cheaper model first
+_ROUTINE_TASKS: frozenset[TaskType] = frozenset(
+    {
+        TaskType.CLASSIFICATION,
+        TaskType.TRANSLATION,
+        TaskType.EXAMPLES,
+        TaskType.SYNONYMS,
+        TaskType.SYLLABLES,
+        TaskType.CONJUGATION,
+        TaskType.MEDIA_SELECTION,
+    }
+)
 
 
 class LLMRouter:
     """Smart routing between expensive and cheap models."""
 
-    @staticmethod
-    def get_model_for_task(task_type: TaskType, num_retries: int) -> LLMVariant:
+    # (first attempt, retry) model per task type. Word validation always uses
+    # the powerful model; quality checks and routine tool execution start on
+    # the cheap one and upgrade on retry or escalation.
+    _ROUTING: dict[TaskType, tuple[LLMVariant, LLMVariant]] = {
+        TaskType.VALIDATION: (LLMVariant.SUPERVISOR, LLMVariant.SUPERVISOR),
+        TaskType.QUALITY_CHECK: (LLMVariant.NODE_EXECUTOR, LLMVariant.SUPERVISOR),
+        **{
+            task_type: (LLMVariant.NODE_EXECUTOR, LLMVariant.SUPERVISOR)
+            for task_type in _ROUTINE_TASKS
+        },
+    }
+    _DEFAULT_ROUTE = (LLMVariant.NODE_EXECUTOR, LLMVariant.NODE_EXECUTOR)
+
+    @classmethod
+    def get_model_for_task(cls, task_type: TaskType, num_retries: int) -> LLMVariant:
         """Select appropriate LLM model based on task complexity."""
+        executor, retry = cls._ROUTING.get(task_type, cls._DEFAULT_ROUTE)
+        return retry if num_retries > 1 else executor
 
-        llm_variant = LLMVariant.NODE_EXECUTOR
-
-        # Use powerful model for supervisor decisions
-        if task_type in [
-            TaskType.VALIDATION,
-            TaskType.QUALITY_CHECK,
-        ]:
-            llm_variant = LLMVariant.SUPERVISOR
-
-        # Use cheaper model for routine tool execution, upgrade on retry
-        if task_type in [
-            TaskType.CLASSIFICATION,
-            TaskType.TRANSLATION,
-            TaskType.EXAMPLES,
-            TaskType.SYNONYMS,
-            TaskType.SYLLABLES,
-            TaskType.CONJUGATION,
-            TaskType.MEDIA_SELECTION,
-        ]:
-            llm_variant: LLMVariant | LLMVariant = (
-                LLMVariant.SUPERVISOR if num_retries > 1 else LLMVariant.NODE_EXECUTOR
-            )
+    @classmethod
+    def get_escalation_model(cls, task_type: TaskType) -> LLMVariant:
+        """Select the model a task is escalated to when the first answer is unsure."""
+        return cls._ROUTING.get(task_type, cls._DEFAULT_ROUTE)[1]
+
+
+# Validation prompt shared by all tools. Everything up to the context section is
+# the same for every call of a tool (the schema, tool name and quality threshold
+# are filled in once per tool by VocabSupervisor), so the provider can reuse its
+# cached prefix; the word-specific parts come last
+_VALIDATION_PROMPT = Template("""
+            **VALIDATION TASK**
+            You are a language learning expert. Your task is to validate the work of a language learning assistant. The overall goal of the assistant is to create accurate and informative vocabulary learning materials.
+
+            **Assistant's Role:**
+            The assistant is a language learning expert. It is tasked with creating accurate and informative vocabulary learning materials.
+
+            **Assistant's Output:**
+            The assistant's output is a JSON object that conforms to the expected schema.
+            Assistant used tool: $tool_name
+
+
+            **1. Expected Output Schema:**
+            The output MUST conform to this Pydantic model schema:
+            --- SCHEMA START ---
+            $schema
+            --- SCHEMA END ---
+
+            **Instructions for you, the Supervisor:**
+            1.  **Schema Compliance:** First and foremost, check if the JSON output complies with the Pydantic schema. Are all required fields present? Are the data types correct? A stringified JSON output is also valid.
+
+            2.  **Requirement Adherence:** Carefully read the 'REQUIREMENTS' section in the prompt. Has the assistant followed all instructions?
+
+            3. **Content Quality:** The overall goal is to create an accurate and natural vocabulary learning material from the source word to the target word given in the context below. The content of the output should be accurate, informative and helpful for learning the target word.
+            
+            4. **Quality Score:** Rate the output on a scale of 1-10, where 10 is perfect. The score should reflect both schema compliance and adherence to the prompt's requirements as well as content quality. A low score should be given if either is not met.
+
+            5.  **Issues and Suggestions:**
+                - If the score is below $quality_threshold, you MUST provide a list of found issues. Each issue should be a clear, concise statement describing a specific failure (e.g., "Field 'x' is missing", "Translation for 'y' is unnatural", "Source word "z" as a matter of fact does exist in the source language and is used in certain parts of the world").
+                - If there are issues, you MUST also provide a list of suggestions for the assistant to improve the output on the next attempt. Suggestions should be actionable and directly related to the issues found.
+
+            Your response MUST be a valid JSON object matching the ToolValidationResult schema.
+            The score should be between 1 and 10 and should reflect the accuracy and quality of the output based on the given conditions. If the score is $quality_threshold or higher, don't provide any issues or suggestions, just return the score.
+
+            Context:
+            Source word: '$source_word' ('$source_language_value')
+            Target word: '$target_word' ('$target_language_value')
+
+            **2. Input Prompt:**
+            This was the prompt given to the assistant:
+            --- PROMPT START ---
+            $prompt
+            --- PROMPT END ---
+
+            **3. Assistant's Output:**
+            Here is the assistants output using the above Pydantic model schema:
+            --- JSON START ---
+            $result
+            --- JSON END ---
+            """)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize nested pydantic models as data, anything else as text."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+# A leading article or particle, written out ("la casa", "to run") or elided
+# ("l'acqua", "un'amica")
+_LEADING_ARTICLE_RGX = re.compile(
+    r"^(?:(?:the|to|a|an|der|die|das|den|dem|des|ein|eine|el|la|lo|los|las|le|les"
+    r"|il|i|gli|un|una|uno|une)\s+|(?:l|un|d|dell|all|nell|dall|sull)['’])",
+    re.IGNORECASE,
+)
+
+
+def _letters(text: str) -> str:
+    """Casefolded letters and digits of a text, for spelling comparisons."""
+    return "".join(filter(str.isalnum, text.casefold()))
+
+
+def _spellings(word: str) -> set[str]:
+    """Letters of a word with and without its leading article."""
+    word = word.strip()
+    return {_letters(word), _letters(_LEADING_ARTICLE_RGX.sub("", word, count=1))}
+
+
+# Image sizes of a successfully retrieved media photo
+_PHOTO_SRC_SIZES = frozenset({"large2x", "large", "medium"})
+
+# Expected output model of each quality-gated tool
+_TOOL_SCHEMAS: dict[str, type[BaseModel]] = {
+    "validation": WordValidationResult,
+    "classification": WordClassification,
+    "translation": Translation,
+    "examples": Examples,
+    "synonyms": Synonyms,
+    "syllables": SyllableBreakdown,
+    "conjugation": ConjugationResponse,
+    "media": SearchQueryResult,
+}
+
+# Schema text for the validation prompt, rendered once per cold start; "$" (e.g.
+# in "$defs") is escaped so it survives the template substitution
+_TOOL_SCHEMA_SPEC: dict[str, str] = {
+    tool: str(schema_class.model_json_schema()).replace("$", "$$")
+    for tool, schema_class in _TOOL_SCHEMAS.items()
+}
+
+
+def _check_syllables(result: dict, state: VocabState) -> Optional[ToolValidationResult]:
+    """Reject syllables that don't spell the target word."""
+    syllables = result.get("syllables")
+    if not syllables or not state.target_word:
+        return None
+
+    # The syllables must spell the word, with or without its article; case,
+    # whitespace, hyphens and apostrophes don't count
+    if _letters("".join(syllables)) in _spellings(state.target_word):
+        return None
+
+    return ToolValidationResult.model_construct(
+        score=3.0,
+        issues=[f"Syllables {syllables} do not spell the word '{state.target_word}'"],
+        suggestions=[
+            f"Split exactly the letters of '{state.target_word}' into syllables"
+        ],
+    )
+
+
+def _check_conjugation(
+    result: dict, state: VocabState
+) -> Optional[ToolValidationResult]:
+    """Reject conjugation runs that failed before producing a table."""
+    conjugation = result.get("result")
+    if not isinstance(conjugation, str) or not conjugation.startswith(
+        CONJUGATION_ERROR_PREFIX
+    ):
+        return None
+
+    return ToolValidationResult.model_construct(
+        score=0.0,
+        issues=[conjugation],
+        suggestions=[f"Create the full conjugation table for '{state.target_word}'"],
+    )
 
-        return llm_variant
+
+# Local checks per tool, run before the LLM validation
+_PRECHECKS: dict[str, Callable[[dict, VocabState], Optional[ToolValidationResult]]] = {
+    "syllables": _check_syllables,
+    "conjugation": _check_conjugation,
+}
 
 
 class VocabSupervisor:
     """Supervisor for vocabulary processing quality control."""
 
-    def __init__(self, quality_threshold: float = 7.5, max_retries: int = 2):
+    # State that must be present and approved before the parallel tools run
+    _REQUIRED_FIELDS = (
+        "source_word",
+        "target_word",
+        "source_language",
+        "target_language",
+    )
+    _QUALITY_GATE_FIELDS = (
+        "validation_passed",
+        "classification_quality_approved",
+        "translation_quality_approved",
+    )
+
+    # Tools that should skip quality validation
+    skip_validation_tools = frozenset({"pronunciation"})
+
+    # Tools whose prompts accept quality feedback on retry
+    _FEEDBACK_TOOLS = frozenset(
+        {
+            "synonyms",
+            "examples",
+            "media",
+            "translation",
+            "validation",
+            "classification",
+            "syllables",
+            "conjugation",
+        }
+    )
+
+    # Parallel tasks scheduled for every word
+    _CORE_PARALLEL_TASKS = ("media", "examples", "synonyms", "syllables")
+
+    def __init__(
+        self,
+        quality_threshold: float = 7.5,
+        max_retries: int = 2,
+        escalation_margin: float = 1.0,
+    ):
         self.quality_threshold = quality_threshold
         self.max_retries = max_retries
+        # Cheap-model verdicts within the margin of the threshold are re-checked
+        # by the powerful model, clear approvals and rejections stand as they are
+        self.escalation_margin = escalation_margin
         self.router = LLMRouter()
 
-        # Tools that should skip quality validation
-        self.skip_validation_tools = {"pronunciation"}
-
         # Define expected schemas for each tool with actual Pydantic models
-        self.tool_schemas: dict[str, BaseModel] = {
-            "validation": WordValidationResult,
-            "classification": WordClassification,
-            "translation": Translation,
-            "examples": Examples,
-            "synonyms": Synonyms,
-            "syllables": SyllableBreakdown,
-            "conjugation": ConjugationResponse,
-            "media": SearchQueryResult,
+        self.tool_schemas = _TOOL_SCHEMAS
+        # Static prefix of the validation prompt, rendered once per tool
+        self._prompt_templates: dict[str, Template] = {
+            tool: Template(
+                _VALIDATION_PROMPT.safe_substitute(
+                    schema=schema_spec,
+                    tool_name=tool,
+                    quality_threshold=self.quality_threshold,
+                )
+            )
+            for tool, schema_spec in _TOOL_SCHEMA_SPEC.items()
         }
 
+    def _precheck(
+        self, tool_name: str, result: Any, state: VocabState
+    ) -> Optional[ToolValidationResult]:
+        """Cheap structural checks that settle a validation without the LLM."""
+        check = _PRECHECKS.get(tool_name)
+        if check is None or not isinstance(result, dict):
+            return None
+        return check(result, state)
+
     async def validate_tool_output(
         self, tool_name: str, result: Any, state: VocabState, prompt: str
     ) -> ToolValidationResult:
@@ -122,14 +358,21 @@ class VocabSupervisor:
 
         # Skip validation for tools that don't need it
         if tool_name in self.skip_validation_tools:
-            return ToolValidationResult(score=10.0, issues=[], suggestions=[])
+            return ToolValidationResult.model_construct(
+                score=10.0, issues=[], suggestions=[]
+            )
+
+        # Outputs that are structurally wrong are rejected without an LLM call
+        precheck_result = self._precheck(tool_name, result, state)
+        if precheck_result is not None:
+            return precheck_result
 
         # Special handling for media tool to validate only the search query part
         if tool_name == "media":
             # Check if this is a fallback response (API failure)
             if isinstance(result, dict) and result.get("api_fallback"):
                 logger.info("Media tool used API fallback - accepting with good score")
-                return ToolValidationResult(
+                return ToolValidationResult.model_construct(
                     score=10.0,
                     issues=[],
                     suggestions=[],
@@ -145,11 +388,11 @@ class VocabSupervisor:
                     photos_src = media.get("src")
 
                 if isinstance(photos_src, dict):
-                    if set(photos_src.keys()) == {"large2x", "large", "medium"} and all(
+                    if photos_src.keys() == _PHOTO_SRC_SIZES and all(
                         v.startswith("https://") and v.endswith(".jpg")
                         for v in photos_src.values()
                     ):
-                        return ToolValidationResult(
+                        return ToolValidationResult.model_construct(
                             score=10.0, issues=[], suggestions=[]
                         )
 
@@ -162,72 +405,39 @@ class VocabSupervisor:
                 logger.warning(
                     "Media tool output format unexpected, skipping validation."
                 )
-                return ToolValidationResult(score=10.0, issues=[], suggestions=[])
+                return ToolValidationResult.model_construct(
+                    score=10.0, issues=[], suggestions=[]
+                )
 
         # Get expected schema for the tool
         expected_schema_class = self.tool_schemas.get(tool_name)
         if not expected_schema_class:
             raise ValueError(f"Unknown tool: {tool_name}")
-        else:
-            # Serialize result to a JSON string for the prompt
-            if isinstance(result, BaseModel):
-                result_json_str = result.model_dump_json(indent=2)
-            else:
-                try:
-                    result_json_str = json.dumps(result, indent=2)
-                except TypeError:
-                    result_json_str = str(result)
 
-            validation_prompt = f"""
-            **VALIDATION TASK**
-            You are a language learning expert. Your task is to validate the work of a language learning assistant. The overall goal of the assistant is to create accurate and informative vocabulary learning materials.
-
-            Context:
-            Source word: '{state.source_word}' ('{state.source_language.value if state.source_language else "unknown"}')
-            Target word: '{state.target_word}' ('{state.target_language.value}')
-            Assistant used tool: {tool_name}
-
-            **Assistant's Role:**
-            The assistant is a language learning expert. It is tasked with creating accurate and informative vocabulary learning materials.
-
-            **Assistant's Output:**
-            The assistant's output is a JSON object that conforms to the expected schema.
-
-
-            **1. Expected Output Schema:**
-            The output MUST conform to this Pydantic model schema:
-            --- SCHEMA START ---
-            {expected_schema_class.model_json_schema()}
-            --- SCHEMA END ---
-
-            **2. Input Prompt:**
-            This was the prompt given to the assistant:
-            --- PROMPT START ---
-            {prompt}
-            --- PROMPT END ---
-
-            **3. Assistant's Output:**
-            Here is the assistants output using the above Pydantic model schema:
-            --- JSON START ---
-            {result_json_str}
-            --- JSON END ---
-
-            **Instructions for you, the Supervisor:**
-            1.  **Schema Compliance:** First and foremost, check if the JSON output complies with the Pydantic schema. Are all required fields present? Are the data types correct? A stringified JSON output is also valid.
-
-            2.  **Requirement Adherence:** Carefully read the 'REQUIREMENTS' section in the prompt. Has the assistant followed all instructions?
-
-            3. **Content Quality:** The overall goal is to create an accurate and natural vocabulary learning material from the '{state.source_word}' ('{state.source_language}') to the target word '{state.target_word}' ('{state.target_language}'). The content of the output should be accurate, informative and helpful for learning the target word.
-            
-            4. **Quality Score:** Rate the output on a scale of 1-10, where 10 is perfect. The score should reflect both schema compliance and adherence to the prompt's requirements as well as content quality. A low score should be given if either is not met.
-
-            5.  **Issues and Suggestions:**
-                - If the score is below {self.quality_threshold}, you MUST provide a list of found issues. Each issue should be a clear, concise statement describing a specific failure (e.g., "Field 'x' is missing", "Translation for 'y' is unnatural", "Source word "z" as a matter of fact does exist in the source language and is used in certain parts of the world").
-                - If there are issues, you MUST also provide a list of suggestions for the assistant to improve the output on the next attempt. Suggestions should be actionable and directly related to the issues found.
-
-            Your response MUST be a valid JSON object matching the ToolValidationResult schema.
-            The score should be between 1 and 10 and should reflect the accuracy and quality of the output based on the given conditions. If the score is {self.quality_threshold} or higher, don't provide any issues or suggestions, just return the score.
-            """
+        # Serialize result to a JSON string once, for the prompt and cache key
+        if isinstance(result, BaseModel):
+            result_json_str = result.model_dump_json(indent=2)
+        else:
+            result_json_str = dumps_json(result, default=_json_default, indent=True)
+
+        # The same output for the same word and prompt was already approved,
+        # hand out a copy so callers can't alter the cached entry
+        cache_key = tool_validation_key(tool_name, result_json_str, state, prompt)
+        cached_result = validation_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result.model_copy(deep=True)
+
+        source_language = state.source_language
+        validation_prompt = self._prompt_templates[tool_name].substitute(
+            source_word=state.source_word,
+            source_language_value=(
+                source_language.value if source_language else "unknown"
+            ),
+            target_word=state.target_word,
+            target_language_value=state.target_language.value,
+            prompt=prompt,
+            result=result_json_str,
+        )
 
         try:
             validation_result = await create_llm_response(
@@ -239,66 +449,70 @@ class VocabSupervisor:
                 ),
             )
 
+            if (
+                abs(validation_result.score - self.quality_threshold)
+                < self.escalation_margin
+            ):
+                logger.info(
+                    "quality_check_escalated",
+                    tool_name=tool_name,
+                    first_score=validation_result.score,
+                )
+                validation_result = await create_llm_response(
+                    response_model=ToolValidationResult,
+                    user_prompt=validation_prompt,
+                    system_message=SystemMessages.VALIDATION_SPECIALIST,
+                    llm_provider=self.router.get_escalation_model(
+                        TaskType.QUALITY_CHECK
+                    ),
+                )
+
             # For high scores, clear issues and suggestions
             if validation_result.score >= self.quality_threshold:
                 validation_result.issues = []
                 validation_result.suggestions = []
+                # Only approvals are reused, failed outputs must be re-checked
+                validation_cache.set(cache_key, validation_result)
 
             return validation_result
 
         except Exception as e:
             logger.error(f"Quality validation failed for {tool_name}: {e}")
             # Return default acceptable result to avoid blocking pipeline
-            return ToolValidationResult(
+            return ToolValidationResult.model_construct(
                 score=5.0,
                 issues=[f"Quality validation failed: {str(e)}"],
                 suggestions=["Manual review recommended"],
             )
 
     async def plan_retry_strategy(
-        self, tool_name: str, validation_result: ToolValidationResult, state: VocabState
+        self,
+        tool_name: str,
+        validation_result: ToolValidationResult,
+        state: VocabState,
+        retry_count: Optional[int] = None,
     ) -> RetryStrategy:
         """Determine retry strategy based on validation results."""
 
-        retry_count = getattr(state, f"{tool_name}_retry_count", 0)
+        if retry_count is None:
+            retry_count = state.retry_counts.get(tool_name, 0)
 
         # Don't retry if score is high enough
         if validation_result.score >= self.quality_threshold:
-            return RetryStrategy(
-                should_retry=False,
-                retry_reason="Score meets quality threshold",
-                adjusted_inputs={},
-            )
+            return _NO_RETRY_QUALITY_MET
 
         # On final retry, accept if score is above 6
         if retry_count >= self.max_retries:
             if validation_result.score >= 7.0:
-                return RetryStrategy(
-                    should_retry=False,
-                    retry_reason="Final retry with acceptable score (>= 7.0)",
-                    adjusted_inputs={},
-                )
+                return _NO_RETRY_FINAL_ACCEPTABLE
             else:
-                return RetryStrategy(
-                    should_retry=False,
-                    retry_reason="Maximum retries reached",
-                    adjusted_inputs={},
-                )
+                return _NO_RETRY_MAX_REACHED
 
         # Create quality feedback for supported tools
         adjusted_inputs = {}
 
         # Add quality feedback for tools that support it
-        if tool_name in [
-            "synonyms",
-            "examples",
-            "media",
-            "translation",
-            "validation",
-            "classification",
-            "syllables",
-            "conjugation",
-        ]:
+        if tool_name in self._FEEDBACK_TOOLS:
             # Only include quality feedback if we have issues or suggestions
             if validation_result.issues or validation_result.suggestions:
                 adjusted_inputs["quality_feedback"] = (
@@ -332,44 +546,30 @@ class VocabSupervisor:
         """Determine if state is ready for parallel tool execution."""
 
         # Check if core sequential steps are complete with acceptable quality
-        required_fields = [
-            "source_word",
-            "target_word",
-            "source_language",
-            "target_language",
-        ]
-
-        for field in required_fields:
-            if not getattr(state, field, None):
-                logger.warning(
-                    f"Missing required field for parallel execution: {field}"
-                )
-                return False
+        missing = [f for f in self._REQUIRED_FIELDS if not getattr(state, f, None)]
+        if missing:
+            logger.warning(
+                "Missing required fields for parallel execution", fields=missing
+            )
+            return False
 
         # Check if previous steps passed quality gates
-        quality_fields = [
-            "validation_passed",
-            "classification_quality_approved",
-            "translation_quality_approved",
-        ]
-
-        for field in quality_fields:
-            if not getattr(state, field, False):
-                logger.warning(f"Quality gate not passed: {field}")
-                return False
+        failed = [f for f in self._QUALITY_GATE_FIELDS if not getattr(state, f, False)]
+        if failed:
+            logger.warning("Quality gates not passed", fields=failed)
+            return False
 
         return True
 
     async def coordinate_parallel_tasks(self, state: VocabState) -> list[str]:
         """Determine which parallel tasks should be executed."""
 
-        tasks = []
-
         # Always include these core tasks
-        tasks.extend(["media", "examples", "synonyms", "syllables"])
+        tasks = list(self._CORE_PARALLEL_TASKS)
 
-        # Add conjugation only for verbs
-        if getattr(state, "target_part_of_speech", None) == "verb":
+        # Add conjugation only for conjugatable parts of speech
+        target_part_of_speech = getattr(state, "target_part_of_speech", None)
+        if target_part_of_speech and target_part_of_speech.is_conjugatable:
             tasks.append("conjugation")
 
         # Pronunciation runs after syllables (no quality gate needed)
@@ -382,6 +582,64 @@ class VocabSupervisor:
 supervisor = VocabSupervisor()
 
 
+# Fallback result per tool, built only for the tool that failed
+_FALLBACK_BUILDERS: dict[str, Callable[[dict[str, Any], str], dict[str, Any]]] = {
+    "validation": lambda inputs, error: {
+        "is_valid": False,
+        "source_language": None,
+        "error_message": f"ERROR - Validation tool failed: {error}",
+        "suggestions": [],
+    },
+    "classification": lambda inputs, error: {
+        "source_word": inputs.get("source_word", "word"),
+        "source_definition": ["Definition unavailable"],
+        "source_part_of_speech": "verb",
+        "source_article": None,
+    },
+    "translation": lambda inputs, error: {
+        "target_word": f"ERROR - Translation tool failed: {error}",
+        "target_part_of_speech": "verb",
+        "target_article": None,
+    },
+    "media": lambda inputs, error: {
+        "media": {
+            "url": f"ERROR - Media tool failed: {error}",
+            "alt": f"Image unavailable for {inputs.get('target_word', 'word')}",
+            "src": {"large2x": "", "large": "", "medium": ""},
+            "explanation": "Unable to generate image at this time.",
+            "memory_tip": "Try visualizing the word concept in your mind.",
+        },
+        "english_word": inputs.get("target_word", "word"),
+        "search_query": [],
+        "media_reused": False,
+    },
+    "examples": lambda inputs, error: {
+        "examples": [
+            {
+                "original": f"Example with {inputs.get('source_word', 'word')} unavailable.",
+                "translation": f"Example with {inputs.get('target_word', 'word')} unavailable.",
+                "error_message": f"ERROR - Examples tool failed: {error}",
+            }
+        ]
+    },
+    "synonyms": lambda inputs, error: {"synonyms": []},
+    "syllables": lambda inputs, error: {
+        "syllables": [inputs.get("target_word", "word")],
+        "phonetic_guide": f"ERROR - Syllables tool failed: {error}",
+    },
+    "pronunciation": lambda inputs, error: {
+        "pronunciations": {
+            "audio": f"ERROR - Pronunciation tool failed: {error}",
+            "syllables": None,
+        }
+    },
+    "conjugation": lambda inputs, error: {
+        "conjugation": None,
+        "error_message": f"ERROR - Conjugation tool failed: {error}",
+    },
+}
+
+
 def create_fallback_result(
     tool_name: str, inputs: dict[str, Any], error: str
 ) -> dict[str, Any]:
@@ -390,62 +648,7 @@ def create_fallback_result(
     logger.error(f"Creating fallback result for {tool_name}: {error}")
 
     # Return appropriate fallback based on tool type
-    fallback_results = {
-        "validation": {
-            "is_valid": False,
-            "source_language": None,
-            "error_message": f"ERROR - Validation tool failed: {error}",
-            "suggestions": [],
-        },
-        "classification": {
-            "source_word": inputs.get("source_word", "word"),
-            "source_definition": ["Definition unavailable"],
-            "source_part_of_speech": "verb",
-            "source_article": None,
-        },
-        "translation": {
-            "target_word": "ERROR - Translation tool failed: {error}",
-            "target_part_of_speech": "verb",
-            "target_article": None,
-        },
-        "media": {
-            "media": {
-                "url": "ERROR - Media tool failed: {error}",
-                "alt": f"Image unavailable for {inputs.get('target_word', 'word')}",
-                "src": {"large2x": "", "large": "", "medium": ""},
-                "explanation": "Unable to generate image at this time.",
-                "memory_tip": "Try visualizing the word concept in your mind.",
-            },
-            "english_word": inputs.get("target_word", "word"),
-            "search_query": [],
-            "media_reused": False,
-        },
-        "examples": {
-            "examples": [
-                {
-                    "original": f"Example with {inputs.get('source_word', 'word')} unavailable.",
-                    "translation": f"Example with {inputs.get('target_word', 'word')} unavailable.",
-                    "error_message": f"ERROR - Examples tool failed: {error}",
-                }
-            ]
-        },
-        "synonyms": {"synonyms": []},
-        "syllables": {
-            "syllables": [inputs.get("target_word", "word")],
-            "phonetic_guide": "ERROR - Syllables tool failed: {error}",
-        },
-        "pronunciation": {
-            "pronunciations": {
-                "audio": f"ERROR - Pronunciation tool failed: {error}",
-                "syllables": None,
-            }
-        },
-        "conjugation": {
-            "conjugation": None,
-            "error_message": f"ERROR - Conjugation tool failed: {error}",
-        },
-    }
-
-    return fallback_results.get(
-        tool_name, {"error": f"Tool {tool_name} failed: {error}"}
-    )
+    build = _FALLBACK_BUILDERS.get(tool_name)
+    if build is None:
+        return {"error": f"Tool {tool_name} failed: {error}"}
+    return build(inputs, error)
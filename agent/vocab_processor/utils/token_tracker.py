@@ -7,7 +7,7 @@ from typing import Any, Optional
 from vocab_processor.constants import is_tracing_enabled
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Represents token usage for a single LLM call."""
 
@@ -28,7 +28,7 @@ class TokenUsage:
         return self.completion_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class TestTokenUsage:
     """Aggregated token usage for a complete test case."""
 
@@ -39,6 +39,9 @@ class TestTokenUsage:
     total_tokens: int = 0
     llm_calls: list[TokenUsage] = field(default_factory=list)
     models_used: list[str] = field(default_factory=list)
+    _models_seen: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     def add_llm_call(self, usage: TokenUsage) -> None:
         """Add a single LLM call's token usage to the test totals."""
@@ -47,7 +50,8 @@ class TestTokenUsage:
         self.total_output_tokens += usage.output_tokens
         self.total_tokens += usage.total_tokens
 
-        if usage.model_name and usage.model_name not in self.models_used:
+        if usage.model_name and usage.model_name not in self._models_seen:
+            self._models_seen.add(usage.model_name)
             self.models_used.append(usage.model_name)
 
     def to_dict(self) -> dict[str, Any]:
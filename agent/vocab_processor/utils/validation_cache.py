@@ -0,0 +1,35 @@
+import hashlib
+
+from vocab_processor.utils.core_utils import TTLCache, dumps_json
+
+# Supervisor validations of tool outputs that passed the quality gate
+validation_cache = TTLCache(maxsize=512, ttl=600)
+
+# Approved source word validations, keyed by word and language pair
+word_validation_cache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def make_cache_key(payload: dict) -> str:
+    """Return a stable hash for a JSON-serializable payload."""
+    serialized = dumps_json(payload, sort_keys=True)
+    return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+
+def tool_validation_key(tool_name: str, result_json: str, state, prompt) -> str:
+    """Build the cache key for a supervisor validation of a serialized tool result."""
+    return make_cache_key(
+        {
+            "tool": tool_name,
+            "prompt": prompt,
+            "result": result_json,
+            "source_word": state.source_word,
+            "source_language": state.source_language,
+            "target_word": state.target_word,
+            "target_language": state.target_language,
+        }
+    )
+
+
+def word_validation_key(source_word: str, source_language, target_language) -> tuple:
+    """Build the cache key for a source word validation."""
+    return (source_word, source_language, target_language)